@@ -2,44 +2,129 @@
 Base iRODS client wrapper providing session management and common operations.
 """
 import os
+import threading
+from collections import namedtuple
+from concurrent.futures import ThreadPoolExecutor
 from contextlib import contextmanager
-from typing import Dict, Generator, List, Optional, Union, Any, Tuple
+from typing import AbstractSet, Callable, Dict, Generator, List, Optional, Union, Any, Tuple
 
 from irods.session import iRODSSession
 from irods.meta import iRODSMeta
-from irods.models import Collection, DataObject
+from irods.models import Collection, CollectionMeta, DataObject
 from irods.collection import iRODSCollection
 from irods.data_object import iRODSDataObject
-from irods.exception import CAT_NO_ROWS_FOUND, CollectionDoesNotExist, DataObjectDoesNotExist
+from irods.keywords import FORCE_FLAG_KW
+from irods.exception import (
+    CAT_NO_ROWS_FOUND,
+    CAT_UNKNOWN_COLLECTION,
+    CATALOG_ALREADY_HAS_ITEM_BY_THAT_NAME,
+    CollectionDoesNotExist,
+    DataObjectDoesNotExist,
+)
 
 from rodrunner.models.config import iRODSConfig
 
 
+# Plain-tuple snapshot of the connection settings read on every session open
+ConnCfg = namedtuple(
+    'ConnCfg',
+    ['host', 'port', 'user', 'password', 'zone', 'default_resource'],
+    defaults=(1247, None, None, None, None)
+)
+
+
 class iRODSClient:
     """Base iRODS client wrapper providing session management and common operations."""
     
-    def __init__(self, config: iRODSConfig):
+    def __init__(self, config: iRODSConfig, write_buffer_size: Optional[int] = None):
         """
         Initialize the iRODS client.
         
         Args:
             config: iRODS configuration
+            write_buffer_size: Chunk size in bytes for streamed uploads
+                (defaults to the python-irodsclient setting)
         """
         self.config = config
+        self.write_buffer_size = write_buffer_size
+        self._session: Optional[iRODSSession] = None
+        # Per-thread clones of the persistent session used by batch workers
+        self._local = threading.local()
+        self.reload_config()
+    
+    def reload_config(self) -> None:
+        """
+        Refresh the cached connection settings from ``self.config``.
+        
+        The settings are snapshotted once so that opening a session does not go
+        through the pydantic model on every call. Call this after mutating
+        ``self.config`` for the change to take effect; an open persistent
+        session is replaced by one using the new settings.
+        """
+        cfg = self.config
+        self._cfg = ConnCfg(
+            host=cfg.host,
+            port=cfg.port,
+            user=cfg.user,
+            password=cfg.password,
+            zone=cfg.zone,
+            default_resource=cfg.default_resource
+        )
+        
+        if self._session is not None:
+            self.close_session()
+            self.open_session()
+    
+    def _new_session(self) -> iRODSSession:
+        """
+        Create an iRODS session from the cached connection settings.
+        
+        Returns:
+            iRODS session; the connection is made on first use
+        """
+        cfg = self._cfg
+        session = iRODSSession(host=cfg.host,
+                               port=cfg.port,
+                               user=cfg.user,
+                               password=cfg.password,
+                               zone=cfg.zone)
+        if self.write_buffer_size:
+            session.data_objects.WRITE_BUFFER_SIZE = self.write_buffer_size
+        return session
+    
+    def open_session(self) -> None:
+        """
+        Open a persistent session that ``session()`` reuses until ``close_session()``.
+        
+        Every client method then shares one authenticated connection pool
+        instead of connecting and authenticating on each call.
+        """
+        if self._session is None:
+            self._session = self._new_session()
+    
+    def close_session(self) -> None:
+        """Close the persistent session, if one is open."""
+        if self._session is not None:
+            self._session.cleanup()
+            self._session = None
     
     @contextmanager
     def session(self) -> Generator[iRODSSession, None, None]:
         """
-        Create and yield an iRODS session.
+        Yield the persistent session if one is open, otherwise a new session.
+        
+        Inside a batch worker thread the worker's own clone of the persistent
+        session is yielded instead, so threads never share a session.
         
         Yields:
             iRODS session
         """
-        with iRODSSession(host=self.config.host,
-                         port=self.config.port,
-                         user=self.config.user,
-                         password=self.config.password,
-                         zone=self.config.zone) as session:
+        session = getattr(self._local, 'session', None) or self._session
+        if session is not None:
+            yield session
+            return
+        
+        with self._new_session() as session:
             yield session
     
     def collection_exists(self, path: str) -> bool:
@@ -59,6 +144,19 @@ class iRODSClient:
             except CollectionDoesNotExist:
                 return False
     
+    def collection_exists_batch(self, paths: List[str], max_workers: int = 8) -> Dict[str, bool]:
+        """
+        Check if several collections exist, probing them concurrently.
+        
+        Args:
+            paths: Paths to the collections
+            max_workers: Maximum number of concurrent sessions
+            
+        Returns:
+            Dictionary mapping each path to True if the collection exists
+        """
+        return dict(zip(paths, self._map_paths(self.collection_exists, paths, max_workers)))
+    
     def data_object_exists(self, path: str) -> bool:
         """
         Check if a data object exists.
@@ -80,6 +178,8 @@ class iRODSClient:
         """
         Create a collection and optionally its parent collections.
         
+        Creating a collection that already exists is not an error.
+        
         Args:
             path: Path to the collection
             create_parents: Whether to create parent collections if they don't exist
@@ -88,23 +188,30 @@ class iRODSClient:
             iRODS collection
         """
         with self.session() as session:
-            if create_parents:
-                # Split path into components
-                components = path.strip('/').split('/')
-                current_path = '/'
-                
-                # Create each component if it doesn't exist
-                for component in components:
-                    if not component:
-                        continue
-                    current_path = os.path.join(current_path, component)
-                    try:
-                        coll = session.collections.get(current_path)
-                    except CollectionDoesNotExist:
-                        coll = session.collections.create(current_path)
-                return coll
-            else:
-                return session.collections.create(path)
+            try:
+                # A recursive create builds any missing parents in a single request
+                return session.collections.create(path, recurse=create_parents)
+            except CATALOG_ALREADY_HAS_ITEM_BY_THAT_NAME:
+                return session.collections.get(path)
+    
+    def create_collection_batch(self, paths: List[str], create_parents: bool = True,
+                                max_workers: int = 8) -> List[iRODSCollection]:
+        """
+        Create several collections concurrently.
+        
+        Args:
+            paths: Paths to the collections
+            create_parents: Whether to create parent collections if they don't exist
+            max_workers: Maximum number of concurrent sessions
+            
+        Returns:
+            iRODS collections, in the same order as ``paths``
+        """
+        return self._map_paths(
+            lambda path: self.create_collection(path, create_parents=create_parents),
+            paths,
+            max_workers
+        )
     
     def upload_file(self, local_path: str, irods_path: str, metadata: Dict = None, 
                    force: bool = False, resource: str = None) -> iRODSDataObject:
@@ -122,34 +229,13 @@ class iRODSClient:
             iRODS data object
         """
         with self.session() as session:
-            # Check if data object exists
-            if not force and self.data_object_exists(irods_path):
-                raise FileExistsError(f"Data object already exists: {irods_path}")
-            
-            # Create parent collection if needed
-            parent_coll = os.path.dirname(irods_path)
-            if not self.collection_exists(parent_coll):
-                self.create_collection(parent_coll)
-            
-            # Upload file
-            options = {}
-            if resource:
-                options['destRescName'] = resource
-            elif self.config.default_resource:
-                options['destRescName'] = self.config.default_resource
-                
-            obj = session.data_objects.put(local_path, irods_path, **options)
-            
-            # Add metadata if provided
-            if metadata:
-                for key, value in metadata.items():
-                    obj.metadata.add(key, str(value))
-            
-            return obj
+            return self._put_file(session, local_path, irods_path, metadata=metadata,
+                                  force=force, resource=resource)
     
     def upload_directory(self, local_path: str, irods_path: str, metadata: Dict = None,
                         file_metadata: Dict = None, force: bool = False, 
-                        resource: str = None) -> iRODSCollection:
+                        resource: str = None,
+                        include: Optional[AbstractSet[str]] = None) -> iRODSCollection:
         """
         Upload a directory to iRODS with optional metadata.
         
@@ -160,14 +246,16 @@ class iRODSClient:
             file_metadata: Optional metadata to attach to each data object
             force: Whether to overwrite existing data objects
             resource: Resource to use for upload
+            include: Optional set of file paths, relative to local_path, to
+                upload; all other files are skipped
             
         Returns:
             iRODS collection
         """
         with self.session() as session:
             # Create collection if it doesn't exist
-            if not self.collection_exists(irods_path):
-                coll = self.create_collection(irods_path)
+            if not session.collections.exists(irods_path):
+                coll = session.collections.create(irods_path, recurse=True)
             else:
                 coll = session.collections.get(irods_path)
             
@@ -176,20 +264,25 @@ class iRODSClient:
                 for key, value in metadata.items():
                     coll.metadata.add(key, str(value))
             
-            # Walk through local directory and upload files
+            # Walk through local directory and upload files, reusing this session
+            # so each file does not pay for a new connection
             for root, dirs, files in os.walk(local_path):
                 # Calculate relative path
                 rel_path = os.path.relpath(root, local_path)
                 if rel_path == '.':
                     rel_path = ''
                 
+                # Skip excluded files, and subcollections with nothing to upload
+                if include is not None:
+                    files = [file for file in files if os.path.join(rel_path, file) in include]
+                    if not files:
+                        continue
+                
                 # Create subcollection if needed
                 if rel_path:
                     subcoll_path = os.path.join(irods_path, rel_path)
-                    if not self.collection_exists(subcoll_path):
-                        subcoll = self.create_collection(subcoll_path)
-                    else:
-                        subcoll = session.collections.get(subcoll_path)
+                    if not session.collections.exists(subcoll_path):
+                        session.collections.create(subcoll_path, recurse=True)
                 else:
                     subcoll_path = irods_path
                 
@@ -199,7 +292,8 @@ class iRODSClient:
                     irods_file_path = os.path.join(subcoll_path, file)
                     
                     try:
-                        self.upload_file(
+                        self._put_file(
+                            session,
                             local_file_path, 
                             irods_file_path, 
                             metadata=file_metadata,
@@ -212,6 +306,50 @@ class iRODSClient:
             
             return coll
     
+    def _put_file(self, session: iRODSSession, local_path: str, irods_path: str,
+                  metadata: Optional[Dict[str, str]] = None, force: bool = False,
+                  resource: Optional[str] = None) -> iRODSDataObject:
+        """
+        Upload a file to iRODS over an already open session.
+        
+        Args:
+            session: iRODS session to use
+            local_path: Path to local file
+            irods_path: Destination path in iRODS
+            metadata: Optional metadata to attach to the data object
+            force: Whether to overwrite existing data object
+            resource: Resource to use for upload
+            
+        Returns:
+            iRODS data object
+        """
+        # Check if data object exists
+        if not force and session.data_objects.exists(irods_path):
+            raise FileExistsError(f"Data object already exists: {irods_path}")
+        
+        # Create parent collection if needed
+        parent_coll = os.path.dirname(irods_path)
+        if not session.collections.exists(parent_coll):
+            session.collections.create(parent_coll, recurse=True)
+        
+        # Upload file
+        options: Dict[str, str] = {}
+        if resource:
+            options['destRescName'] = resource
+        elif self._cfg.default_resource:
+            options['destRescName'] = self._cfg.default_resource
+        if force:
+            options[FORCE_FLAG_KW] = ''
+            
+        obj = session.data_objects.put(local_path, irods_path, return_data_object=True, **options)
+        
+        # Add metadata if provided
+        if metadata:
+            for key, value in metadata.items():
+                obj.metadata.add(key, str(value))
+        
+        return obj
+    
     def get_data_object(self, path: str) -> iRODSDataObject:
         """
         Get a data object.
@@ -238,6 +376,28 @@ class iRODSClient:
         with self.session() as session:
             return session.collections.get(path)
     
+    def get_metadata_dict(self, path: str) -> Dict[str, str]:
+        """
+        Get the metadata of a collection as a dictionary.
+        
+        All AVUs are fetched with a single query instead of loading the
+        collection and then its metadata.
+        
+        Args:
+            path: Path to the collection
+            
+        Returns:
+            Dictionary mapping attribute names to values; empty if the
+            collection has no metadata or does not exist. When several AVUs
+            share an attribute name only one of their values is kept (the
+            last one the query returns), and units are dropped.
+        """
+        with self.session() as session:
+            query = session.query(CollectionMeta.name, CollectionMeta.value).filter(
+                Collection.name == path
+            )
+            return {row[CollectionMeta.name]: row[CollectionMeta.value] for row in query}
+    
     def download_file(self, irods_path: str, local_path: str, force: bool = False) -> str:
         """
         Download a file from iRODS.
@@ -274,7 +434,8 @@ class iRODSClient:
         with self.session() as session:
             session.data_objects.unlink(path, force=force)
     
-    def remove_collection(self, path: str, recursive: bool = True, force: bool = False) -> None:
+    def remove_collection(self, path: str, recursive: bool = True, force: bool = False,
+                          ignore_missing: bool = True) -> None:
         """
         Remove a collection.
         
@@ -282,6 +443,72 @@ class iRODSClient:
             path: Path to the collection
             recursive: Whether to remove recursively
             force: Whether to force removal
+            ignore_missing: Whether removing a collection that does not exist
+                succeeds silently instead of raising
         """
         with self.session() as session:
-            session.collections.remove(path, recursive=recursive, force=force)
+            try:
+                session.collections.remove(path, recurse=recursive, force=force)
+            except (CollectionDoesNotExist, CAT_NO_ROWS_FOUND, CAT_UNKNOWN_COLLECTION):
+                # The server reports a missing collection through several error codes
+                if not ignore_missing:
+                    raise
+    
+    def remove_collection_batch(self, paths: List[str], recursive: bool = True,
+                                force: bool = False, max_workers: int = 8,
+                                ignore_missing: bool = True) -> None:
+        """
+        Remove several collections concurrently.
+        
+        Args:
+            paths: Paths to the collections
+            recursive: Whether to remove recursively
+            force: Whether to force removal
+            max_workers: Maximum number of concurrent sessions
+            ignore_missing: Whether collections that do not exist are skipped
+                instead of raising
+        """
+        self._map_paths(
+            lambda path: self.remove_collection(path, recursive=recursive, force=force,
+                                                ignore_missing=ignore_missing),
+            paths,
+            max_workers
+        )
+    
+    def _map_paths(self, func: Callable[[str], Any], paths: List[str],
+                   max_workers: int) -> List[Any]:
+        """
+        Apply a single-path operation to many paths on a thread pool.
+        
+        Without a persistent session each call opens its own session. With
+        one, each worker thread works on its own clone of it, since an
+        iRODSSession must not be shared between threads; the clones are
+        cleaned up when the batch is done. Either way the round trips
+        overlap instead of running back to back.
+        
+        Args:
+            func: Operation to apply to each path
+            paths: Paths to operate on
+            max_workers: Maximum number of concurrent calls
+            
+        Returns:
+            Results of ``func``, in the same order as ``paths``
+        """
+        if not paths:
+            return []
+        
+        persistent = self._session
+        clones: List[iRODSSession] = []
+        
+        def call(path: str) -> Any:
+            if persistent is not None and getattr(self._local, 'session', None) is None:
+                self._local.session = persistent.clone()
+                clones.append(self._local.session)
+            return func(path)
+        
+        try:
+            with ThreadPoolExecutor(max_workers=min(max_workers, len(paths))) as executor:
+                return list(executor.map(call, paths))
+        finally:
+            for clone in clones:
+                clone.cleanup()
@@ -2,13 +2,32 @@
 Base parser class for metadata extraction.
 """
 from abc import ABC, abstractmethod
-from typing import Dict, Any, Optional
+from functools import lru_cache
+from pathlib import Path
+from typing import AbstractSet, Dict, Any, FrozenSet, Iterable, Optional
+
+
+@lru_cache(maxsize=256)
+def _missing_fields(required: FrozenSet[str], present: FrozenSet[str]) -> FrozenSet[str]:
+    """
+    Return the required fields that are not present.
+    
+    Args:
+        required: Fields a parser requires
+        present: Required fields found with a non-empty value
+        
+    Returns:
+        Frozen set of missing fields
+    """
+    return required - present
 
 
 class BaseParser(ABC):
     """Base class for metadata parsers."""
     
-    @abstractmethod
+    # Fields that must be present with a non-empty value for metadata to be valid
+    REQUIRED_FIELDS: FrozenSet[str] = frozenset()
+    
     def parse(self, file_path: str) -> Dict[str, Any]:
         """
         Parse a file and extract metadata.
@@ -16,24 +35,69 @@ class BaseParser(ABC):
         Args:
             file_path: Path to the file to parse
             
+        Returns:
+            Dictionary of extracted metadata
+        """
+        return self.parse_bytes(Path(file_path).read_bytes())
+    
+    @abstractmethod
+    def parse_bytes(self, data: bytes) -> Dict[str, Any]:
+        """
+        Extract metadata from the content of a file.
+        
+        Args:
+            data: Raw file content
+            
         Returns:
             Dictionary of extracted metadata
         """
         pass
     
     @abstractmethod
-    def validate(self, metadata: Dict[str, Any]) -> bool:
+    def validate(self, metadata: Dict[str, Any], *, missing: AbstractSet[str] = frozenset()) -> bool:
         """
         Validate the extracted metadata.
         
         Args:
             metadata: Dictionary of metadata to validate
+            missing: Fields to treat as absent from the metadata, so a negative
+                case can be checked without copying the dictionary
             
         Returns:
             True if the metadata is valid, False otherwise
         """
         pass
     
+    def validate_without(self, metadata: Dict[str, Any], *, missing_fields: Iterable[str]) -> bool:
+        """
+        Validate the metadata as if some fields were absent, without copying it.
+        
+        Args:
+            metadata: Dictionary of metadata to validate
+            missing_fields: Fields to treat as absent from the metadata
+            
+        Returns:
+            True if the metadata would be valid without the fields, False otherwise
+        """
+        return self.validate(metadata, missing=frozenset(missing_fields))
+    
+    def missing_required_fields(self, metadata: Dict[str, Any],
+                                missing: AbstractSet[str] = frozenset()) -> FrozenSet[str]:
+        """
+        Get the required fields that are missing or empty in the metadata.
+        
+        Args:
+            metadata: Dictionary of metadata to check
+            missing: Fields to treat as absent from the metadata
+            
+        Returns:
+            Frozen set of missing field names
+        """
+        present = frozenset(filter(metadata.get, self.REQUIRED_FIELDS))
+        if missing:
+            present -= missing
+        return _missing_fields(self.REQUIRED_FIELDS, present)
+    
     def get_metadata(self, file_path: str) -> Optional[Dict[str, Any]]:
         """
         Parse a file and validate the extracted metadata.
@@ -0,0 +1,13 @@
+"""
+Custom exceptions for metadata parsers.
+"""
+
+
+class ParserError(Exception):
+    """Base exception for metadata parser errors."""
+    pass
+
+
+class ParseError(ParserError):
+    """Exception raised when a metadata file is not well-formed."""
+    pass
@@ -1,18 +1,134 @@
 """
 Factory for creating parsers.
 """
+import hashlib
+import logging
 import os
-from typing import Dict, Any, Optional
+import tempfile
+from contextlib import suppress
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Any, Optional, Type
+
+# orjson is an optional speedup for the metadata cache
+try:
+    import orjson
+    
+    def _dumps(obj: Any) -> bytes:
+        return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS)
+    
+    def _loads(data: bytes) -> Any:
+        return orjson.loads(data)
+except ImportError:
+    import json
+    
+    def _dumps(obj: Any) -> bytes:
+        return json.dumps(obj).encode()
+    
+    def _loads(data: bytes) -> Any:
+        return json.loads(data)
 
 from rodrunner.parsers.base import BaseParser
+from rodrunner.parsers.exceptions import ParserError
 from rodrunner.parsers.runinfo import RunInfoParser
 from rodrunner.parsers.runparameters import RunParametersParser
 from rodrunner.parsers.samplesheet import SampleSheetParser
 
 
+logger = logging.getLogger(__name__)
+
+# Default location for the parse_directory metadata cache
+DEFAULT_CACHE_DIR = '.rodrunner_cache'
+
+# Part of every cache key; bump it whenever parser output changes so
+# entries written by an older parser are not served
+CACHE_VERSION = 2
+
+# Parser classes by lowercased file name
+_DISPATCH: Dict[str, Type[BaseParser]] = {
+    'runinfo.xml': RunInfoParser,
+    'runparameters.xml': RunParametersParser,
+    'samplesheet.csv': SampleSheetParser,
+}
+
+
+def _cache_file(cache_dir: str, file_path: str) -> str:
+    """
+    Get the cache file for the current version of a file.
+    
+    Args:
+        cache_dir: Directory holding cached metadata
+        file_path: Path to the parsed file
+        
+    Returns:
+        Path to the cache file; it changes whenever the file is modified
+        or CACHE_VERSION is bumped
+    """
+    stat = os.stat(file_path)
+    key = f"{CACHE_VERSION}\0{os.path.abspath(file_path)}\0{stat.st_mtime_ns}\0{stat.st_size}"
+    return os.path.join(cache_dir, hashlib.sha1(key.encode()).hexdigest() + '.json')
+
+
+def _get_cached_metadata(parser: BaseParser, file_path: str,
+                         cache_dir: str) -> Optional[Dict[str, Any]]:
+    """
+    Get validated metadata from the cache, parsing and caching it on a miss.
+    
+    Args:
+        parser: Parser for the file
+        file_path: Path to the file to parse
+        cache_dir: Directory holding cached metadata
+        
+    Returns:
+        Dictionary of validated metadata, or None if validation fails
+    """
+    cache_file = _cache_file(cache_dir, file_path)
+    try:
+        with open(cache_file, 'rb') as f:
+            cached: Dict[str, Any] = _loads(f.read())
+        return cached
+    except (OSError, ValueError):
+        pass
+    
+    metadata = parser.get_metadata(file_path)
+    if metadata:
+        # Write to a temporary file first so concurrent readers never see a partial entry
+        fd, tmp_path = tempfile.mkstemp(dir=cache_dir, suffix='.tmp')
+        try:
+            with os.fdopen(fd, 'wb') as f:
+                f.write(_dumps(metadata))
+            os.replace(tmp_path, cache_file)
+        except (OSError, TypeError, ValueError):
+            # The cache is only an optimization; drop the partial entry
+            with suppress(FileNotFoundError):
+                os.unlink(tmp_path)
+    
+    return metadata
+
+
 class ParserFactory:
     """Factory for creating parsers."""
     
+    @staticmethod
+    def get_parser(file_path: str) -> BaseParser:
+        """
+        Get a parser for the given file name.
+        
+        Args:
+            file_path: Path or name of the file to parse; the file does not
+                need to exist
+            
+        Returns:
+            Parser instance
+            
+        Raises:
+            ValueError: If no parser is available for the file name
+        """
+        try:
+            parser_class = _DISPATCH[os.path.basename(file_path).lower()]
+        except KeyError:
+            raise ValueError(f"No parser available for {file_path}") from None
+        return parser_class()
+    
     @staticmethod
     def create_parser(file_path: str) -> Optional[BaseParser]:
         """
@@ -22,21 +138,14 @@ class ParserFactory:
             file_path: Path to the file to parse
             
         Returns:
-            Parser instance, or None if no parser is available
+            Parser instance, or None if the file does not exist or no parser
+            is available
         """
-        if not os.path.exists(file_path):
+        parser_class = _DISPATCH.get(os.path.basename(file_path).lower())
+        if parser_class is None or not os.path.exists(file_path):
             return None
         
-        file_name = os.path.basename(file_path).lower()
-        
-        if file_name == 'runinfo.xml':
-            return RunInfoParser()
-        elif file_name == 'runparameters.xml':
-            return RunParametersParser()
-        elif file_name == 'samplesheet.csv':
-            return SampleSheetParser()
-        
-        return None
+        return parser_class()
     
     @staticmethod
     def parse_file(file_path: str) -> Optional[Dict[str, Any]]:
@@ -56,6 +165,56 @@ class ParserFactory:
         
         return None
     
+    @staticmethod
+    def parse_directory(directory: str, max_workers: int = 8,
+                        cache_dir: Optional[str] = None) -> Dict[str, Dict[str, Any]]:
+        """
+        Parse all supported files directly inside a directory concurrently.
+        
+        Args:
+            directory: Path to the directory
+            max_workers: Maximum number of files parsed at the same time
+            cache_dir: Directory for cached metadata, e.g. DEFAULT_CACHE_DIR;
+                files that are unchanged since they were cached are not
+                parsed again. Caching is disabled if None
+            
+        Returns:
+            Dictionary mapping file names to their extracted metadata; files
+            that cannot be read or parsed, or that fail validation, are left out
+        """
+        # scandir gives names and file types without a stat call per entry
+        with os.scandir(directory) as entries:
+            parsers = {
+                entry.name: (_DISPATCH[entry.name.lower()](), entry.path)
+                for entry in sorted(entries, key=lambda entry: entry.name)
+                if entry.name.lower() in _DISPATCH and entry.is_file()
+            }
+        
+        if not parsers:
+            return {}
+        
+        if cache_dir is not None:
+            os.makedirs(cache_dir, exist_ok=True)
+        
+        # Parsing is mostly file I/O and lxml/csv C code, so threads overlap well
+        metadata = {}
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(parsers))) as executor:
+            futures = {
+                name: (executor.submit(parser.get_metadata, path) if cache_dir is None
+                       else executor.submit(_get_cached_metadata, parser, path, cache_dir))
+                for name, (parser, path) in parsers.items()
+            }
+            for name, future in futures.items():
+                try:
+                    result = future.result()
+                except (OSError, ParserError, ValueError) as e:
+                    logger.warning(f"Skipping {name}: {str(e)}")
+                    continue
+                if result:
+                    metadata[name] = result
+        
+        return metadata
+    
     @staticmethod
     def parse_sequencer_run(run_dir: str) -> Dict[str, Any]:
         """
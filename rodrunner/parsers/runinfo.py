@@ -1,101 +1,204 @@
 """
 Parser for RunInfo.xml files.
 """
-import xml.etree.ElementTree as ET
-from typing import Dict, Any, List, Optional
+import io
+import os
+from typing import AbstractSet, Dict, Any, Iterator, Optional, Tuple, cast
+
+from lxml import etree
 
 from rodrunner.parsers.base import BaseParser
+from rodrunner.parsers.exceptions import ParseError
+
+
+def _iterparse(data: bytes) -> Iterator[Tuple[str, etree._Element]]:
+    """
+    Iterate over start/end events of an XML document with a strict lxml parser.
+    
+    Args:
+        data: Raw XML content
+        
+    Yields:
+        (event, element) tuples
+    """
+    try:
+        yield from etree.iterparse(io.BytesIO(data), events=('start', 'end'), remove_blank_text=True,
+                                   resolve_entities=False, recover=False)
+    except etree.XMLSyntaxError as e:
+        raise ParseError(f"Malformed RunInfo XML: {e}") from e
+
+
+def _strip_namespaces(data: bytes) -> bytes:
+    """
+    Remove namespaces from the element tags of an XML document.
+    
+    Args:
+        data: Raw XML content
+        
+    Returns:
+        The document re-serialized with plain element tags
+    """
+    parser = etree.XMLParser(remove_blank_text=True, resolve_entities=False, recover=False)
+    try:
+        root = etree.fromstring(data, parser)
+    except etree.XMLSyntaxError as e:
+        raise ParseError(f"Malformed RunInfo XML: {e}") from e
+    
+    for elem in root.iter(etree.Element):
+        elem.tag = etree.QName(elem).localname
+    etree.cleanup_namespaces(root)
+    return cast(bytes, etree.tostring(root))
 
 
 class RunInfoParser(BaseParser):
     """Parser for RunInfo.xml files."""
     
+    REQUIRED_FIELDS = frozenset({'run_id', 'flowcell', 'instrument'})
+    
+    # Number of leading bytes checked for a default namespace declaration
+    NAMESPACE_PEEK_BYTES = 256
+    
+    # Limits that bound the work spent on a single file; real RunInfo.xml
+    # files are well under 100 KiB with at most a handful of reads
+    MAX_BYTES = 10 * 1024 * 1024
+    MAX_READS = 32
+    
     def parse(self, file_path: str) -> Dict[str, Any]:
         """
         Parse a RunInfo.xml file and extract metadata.
         
         Args:
-            file_path: Path to the RunInfo.xml file
+            file_path: Path to the file to parse
             
         Returns:
             Dictionary of extracted metadata
+            
+        Raises:
+            ValueError: If the file is larger than MAX_BYTES
         """
-        tree = ET.parse(file_path)
-        root = tree.getroot()
+        # Reject oversized files before reading them into memory
+        size = os.path.getsize(file_path)
+        if size > self.MAX_BYTES:
+            raise ValueError(f"RunInfo too large: {size} bytes")
         
-        # Extract run information
-        run_node = root.find('Run')
-        if run_node is None:
-            return {}
+        return super().parse(file_path)
+    
+    def parse_bytes(self, data: bytes) -> Dict[str, Any]:
+        """
+        Extract metadata from the content of a RunInfo.xml file.
         
-        run_id = run_node.get('Id', '')
-        run_number = run_node.get('Number', '')
-        
-        # Extract flowcell information
-        flowcell = run_node.findtext('Flowcell', '')
-        instrument = run_node.findtext('Instrument', '')
-        date = run_node.findtext('Date', '')
-        
-        # Extract reads information
-        reads_node = run_node.find('Reads')
-        reads = []
-        
-        if reads_node is not None:
-            for read_node in reads_node.findall('Read'):
-                read = {
-                    'number': read_node.get('Number', ''),
-                    'num_cycles': read_node.get('NumCycles', ''),
-                    'is_indexed_read': read_node.get('IsIndexedRead', '')
-                }
-                reads.append(read)
-        
-        # Extract flowcell layout
-        flowcell_layout_node = run_node.find('FlowcellLayout')
-        flowcell_layout = {}
-        
-        if flowcell_layout_node is not None:
-            flowcell_layout = {
-                'lane_count': flowcell_layout_node.get('LaneCount', ''),
-                'surface_count': flowcell_layout_node.get('SurfaceCount', ''),
-                'swath_count': flowcell_layout_node.get('SwathCount', ''),
-                'tile_count': flowcell_layout_node.get('TileCount', '')
-            }
+        Args:
+            data: Raw RunInfo.xml content
+            
+        Returns:
+            Dictionary of extracted metadata
+            
+        Raises:
+            ValueError: If the content is larger than MAX_BYTES or the Run has
+                more than MAX_READS reads
+        """
+        if len(data) > self.MAX_BYTES:
+            raise ValueError(f"RunInfo too large: {len(data)} bytes")
+        
+        # Illumina writes RunInfo.xml without a default namespace, so the plain
+        # tag comparisons below are the common path; other documents are
+        # rewritten with plain tags first
+        if b'xmlns=' in data[:self.NAMESPACE_PEEK_BYTES]:
+            data = _strip_namespaces(data)
+        
+        run_attrib = None
+        run_done = False
+        reads_seen = 0
+        texts: Dict[str, str] = {}
+        reads = None
+        flowcell_layout = None
+        
+        # Stream the document, keeping only the first Run and freeing each
+        # handled subtree so memory stays flat for large RunInfo.xml files
+        path = []
+        for event, elem in _iterparse(data):
+            if event == 'start':
+                path.append(elem.tag)
+                if len(path) == 2 and elem.tag == 'Run' and run_attrib is None:
+                    run_attrib = dict(elem.attrib)
+                elif (len(path) == 4 and elem.tag == 'Read' and path[1] == 'Run'
+                      and path[2] == 'Reads' and not run_done):
+                    # Count reads as they start so a crafted file fails early
+                    reads_seen += 1
+                    if reads_seen > self.MAX_READS:
+                        raise ValueError(f"RunInfo has more than {self.MAX_READS} reads")
+                continue
+            
+            depth = len(path)
+            path.pop()
+            
+            if depth == 3 and path[1] == 'Run' and not run_done:
+                tag = elem.tag
+                if tag in ('Flowcell', 'Instrument', 'Date'):
+                    texts.setdefault(tag, elem.text or '')
+                elif tag == 'Reads' and reads is None:
+                    reads = [
+                        {
+                            'number': read_node.get('Number', ''),
+                            'num_cycles': read_node.get('NumCycles', ''),
+                            'is_indexed_read': read_node.get('IsIndexedRead', '')
+                        }
+                        for read_node in elem.findall('Read')
+                    ]
+                elif tag == 'FlowcellLayout' and flowcell_layout is None:
+                    flowcell_layout = {
+                        'lane_count': elem.get('LaneCount', ''),
+                        'surface_count': elem.get('SurfaceCount', ''),
+                        'swath_count': elem.get('SwathCount', ''),
+                        'tile_count': elem.get('TileCount', '')
+                    }
+                elem.clear()
+                # Drop already handled siblings so the Run element does not grow
+                parent = elem.getparent()
+                while elem.getprevious() is not None:
+                    del parent[0]
+            elif depth == 2:
+                if elem.tag == 'Run' and run_attrib is not None:
+                    run_done = True
+                elem.clear()
+        
+        if run_attrib is None:
+            return {}
         
         # Compile metadata
         metadata = {
-            'run_id': run_id,
-            'run_number': run_number,
-            'flowcell': flowcell,
-            'instrument': instrument,
-            'date': date,
-            'reads': reads,
-            'flowcell_layout': flowcell_layout
+            'run_id': run_attrib.get('Id', ''),
+            'run_number': run_attrib.get('Number', ''),
+            'flowcell': texts.get('Flowcell', ''),
+            'instrument': texts.get('Instrument', ''),
+            'date': texts.get('Date', ''),
+            'reads': reads or [],
+            'flowcell_layout': flowcell_layout or {}
         }
         
         return metadata
     
-    def validate(self, metadata: Dict[str, Any]) -> bool:
+    def validate(self, metadata: Dict[str, Any], *, missing: AbstractSet[str] = frozenset()) -> bool:
         """
         Validate the extracted metadata.
         
         Args:
             metadata: Dictionary of metadata to validate
+            missing: Fields to treat as absent from the metadata
             
         Returns:
             True if the metadata is valid, False otherwise
         """
         # Check for required fields
-        required_fields = ['run_id', 'flowcell', 'instrument']
-        for field in required_fields:
-            if field not in metadata or not metadata[field]:
-                return False
+        if self.missing_required_fields(metadata, missing):
+            return False
         
         # Check for reads
-        if 'reads' not in metadata or not isinstance(metadata['reads'], list):
+        if 'reads' in missing or not isinstance(metadata.get('reads'), list):
             return False
         
         # Check for flowcell layout
-        if 'flowcell_layout' not in metadata or not isinstance(metadata['flowcell_layout'], dict):
+        if 'flowcell_layout' in missing or not isinstance(metadata.get('flowcell_layout'), dict):
             return False
         
         return True
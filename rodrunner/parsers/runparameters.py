@@ -1,57 +1,94 @@
 """
 Parser for RunParameters.xml files.
 """
-import xml.etree.ElementTree as ET
-from typing import Dict, Any, List, Optional
+from types import MappingProxyType
+from typing import AbstractSet, Dict, Any, Mapping
+
+from lxml import etree
 
 from rodrunner.parsers.base import BaseParser
+from rodrunner.parsers.exceptions import ParseError
+
+
+# Shared strict parser: fails on the first structural error and never expands entities
+_PARSER = etree.XMLParser(remove_blank_text=True, resolve_entities=False, recover=False)
+
+# Element name -> metadata key; instruments disagree on the spelling of several tags
+_FIELD_MAP: Mapping[str, str] = MappingProxyType({
+    'InstrumentType': 'instrument_type',
+    'RunID': 'run_id',
+    'RunId': 'run_id',
+    'InstrumentID': 'scanner_id',
+    'InstrumentId': 'scanner_id',
+    'ScannerID': 'scanner_id',
+    'ScannerId': 'scanner_id',
+    'RTAVersion': 'rta_version',
+    'RtaVersion': 'rta_version',
+    'ApplicationName': 'application_name',
+    'ApplicationVersion': 'application_version',
+    'ExperimentName': 'experiment_name',
+    'Chemistry': 'chemistry',
+    'RunSetupMode': 'run_setup_mode',
+    'FlowCellMode': 'flow_cell_mode',
+    'SequencingKitNumber': 'sequencing_kit_number',
+    'Read1NumberOfCycles': 'read1_cycles',
+    'Read2NumberOfCycles': 'read2_cycles',
+    'IndexRead1NumberOfCycles': 'index1_cycles',
+    'IndexRead2NumberOfCycles': 'index2_cycles',
+})
+
+# Keys that are always present in the parsed metadata, empty when not found
+_DEFAULT_KEYS = (
+    'instrument_type', 'run_id', 'experiment_name', 'sequencing_kit_number',
+    'read1_cycles', 'read2_cycles', 'index1_cycles', 'index2_cycles',
+)
 
 
 class RunParametersParser(BaseParser):
     """Parser for RunParameters.xml files."""
     
-    def parse(self, file_path: str) -> Dict[str, Any]:
+    REQUIRED_FIELDS = frozenset({'instrument_type', 'run_id'})
+    
+    # Read cycle fields may be empty but must be present
+    CYCLE_FIELDS = frozenset({'read1_cycles', 'read2_cycles', 'index1_cycles', 'index2_cycles'})
+    
+    def parse_bytes(self, data: bytes) -> Dict[str, Any]:
         """
-        Parse a RunParameters.xml file and extract metadata.
+        Extract metadata from the content of a RunParameters.xml file.
         
         Args:
-            file_path: Path to the RunParameters.xml file
+            data: Raw RunParameters.xml content
             
         Returns:
             Dictionary of extracted metadata
         """
-        tree = ET.parse(file_path)
-        root = tree.getroot()
-        
-        # Extract common parameters
-        metadata = {}
-        
-        # Extract instrument type
-        instrument_type = root.findtext('InstrumentType', '')
-        metadata['instrument_type'] = instrument_type
-        
-        # Extract run ID
-        run_id = root.findtext('RunId', '')
-        metadata['run_id'] = run_id
-        
-        # Extract experiment name
-        experiment_name = root.findtext('ExperimentName', '')
-        metadata['experiment_name'] = experiment_name
-        
-        # Extract sequencing kit number
-        sequencing_kit_number = root.findtext('SequencingKitNumber', '')
-        metadata['sequencing_kit_number'] = sequencing_kit_number
-        
-        # Extract read cycle information
-        read1_cycles = root.findtext('Read1NumberOfCycles', '')
-        read2_cycles = root.findtext('Read2NumberOfCycles', '')
-        index1_cycles = root.findtext('IndexRead1NumberOfCycles', '')
-        index2_cycles = root.findtext('IndexRead2NumberOfCycles', '')
-        
-        metadata['read1_cycles'] = read1_cycles
-        metadata['read2_cycles'] = read2_cycles
-        metadata['index1_cycles'] = index1_cycles
-        metadata['index2_cycles'] = index2_cycles
+        try:
+            root = etree.fromstring(data, _PARSER)
+        except etree.XMLSyntaxError as e:
+            raise ParseError(f"Malformed RunParameters XML: {e}") from e
+        
+        # Extract common parameters from the root's children in a single pass;
+        # the first occurrence of each key wins
+        metadata = dict.fromkeys(_DEFAULT_KEYS, '')
+        found = set()
+        setup = None
+        for elem in root:
+            if elem.tag == 'Setup':
+                setup = elem
+                continue
+            key = _FIELD_MAP.get(elem.tag)
+            if key is not None and key not in found:
+                found.add(key)
+                metadata[key] = elem.text or ''
+        
+        # MiSeq keeps some parameters in <Setup>; they only fill keys the root lacks
+        if setup is not None:
+            for elem in setup:
+                key = _FIELD_MAP.get(elem.tag)
+                if key is not None and key not in found:
+                    found.add(key)
+                    metadata[key] = elem.text or ''
+        instrument_type = metadata['instrument_type']
         
         # Extract platform-specific parameters
         if instrument_type.lower() == 'novaseqxplus':
@@ -67,7 +104,7 @@ class RunParametersParser(BaseParser):
         
         return metadata
     
-    def _parse_novaseqxplus_parameters(self, root: ET.Element, metadata: Dict[str, Any]) -> None:
+    def _parse_novaseqxplus_parameters(self, root: etree._Element, metadata: Dict[str, Any]) -> None:
         """
         Parse NovaSeq X Plus specific parameters.
         
@@ -78,7 +115,7 @@ class RunParametersParser(BaseParser):
         # Extract NovaSeq X Plus specific parameters
         pass
     
-    def _parse_novaseq_parameters(self, root: ET.Element, metadata: Dict[str, Any]) -> None:
+    def _parse_novaseq_parameters(self, root: etree._Element, metadata: Dict[str, Any]) -> None:
         """
         Parse NovaSeq specific parameters.
         
@@ -94,7 +131,7 @@ class RunParametersParser(BaseParser):
         chemistry_version = root.findtext('ChemistryVersion', '')
         metadata['chemistry_version'] = chemistry_version
     
-    def _parse_nextseq_parameters(self, root: ET.Element, metadata: Dict[str, Any]) -> None:
+    def _parse_nextseq_parameters(self, root: etree._Element, metadata: Dict[str, Any]) -> None:
         """
         Parse NextSeq specific parameters.
         
@@ -106,7 +143,7 @@ class RunParametersParser(BaseParser):
         chemistry_version = root.findtext('ChemistryVersion', '')
         metadata['chemistry_version'] = chemistry_version
     
-    def _parse_miseq_parameters(self, root: ET.Element, metadata: Dict[str, Any]) -> None:
+    def _parse_miseq_parameters(self, root: etree._Element, metadata: Dict[str, Any]) -> None:
         """
         Parse MiSeq specific parameters.
         
@@ -114,11 +151,10 @@ class RunParametersParser(BaseParser):
             root: XML root element
             metadata: Dictionary to update with extracted metadata
         """
-        # Extract MiSeq specific parameters
-        chemistry = root.findtext('Chemistry', '')
-        metadata['chemistry'] = chemistry
+        # Chemistry is read with the common parameters; keep the key when absent
+        metadata.setdefault('chemistry', '')
     
-    def _parse_iseq_parameters(self, root: ET.Element, metadata: Dict[str, Any]) -> None:
+    def _parse_iseq_parameters(self, root: etree._Element, metadata: Dict[str, Any]) -> None:
         """
         Parse iSeq specific parameters.
         
@@ -129,26 +165,23 @@ class RunParametersParser(BaseParser):
         # Extract iSeq specific parameters
         pass
     
-    def validate(self, metadata: Dict[str, Any]) -> bool:
+    def validate(self, metadata: Dict[str, Any], *, missing: AbstractSet[str] = frozenset()) -> bool:
         """
         Validate the extracted metadata.
         
         Args:
             metadata: Dictionary of metadata to validate
+            missing: Fields to treat as absent from the metadata
             
         Returns:
             True if the metadata is valid, False otherwise
         """
         # Check for required fields
-        required_fields = ['instrument_type', 'run_id']
-        for field in required_fields:
-            if field not in metadata or not metadata[field]:
-                return False
+        if self.missing_required_fields(metadata, missing):
+            return False
         
         # Check for read cycle information
-        cycle_fields = ['read1_cycles', 'read2_cycles', 'index1_cycles', 'index2_cycles']
-        for field in cycle_fields:
-            if field not in metadata:
-                return False
+        if not (self.CYCLE_FIELDS <= metadata.keys() and self.CYCLE_FIELDS.isdisjoint(missing)):
+            return False
         
         return True
@@ -2,61 +2,224 @@
 Parser for SampleSheet files (both v1 and v2 formats).
 """
 import csv
-import os
-from typing import Dict, Any, List, Optional, Tuple
+import io
+import sys
+from functools import lru_cache
+from itertools import repeat
+from typing import AbstractSet, Callable, Dict, Any, Iterable, List
 
 from rodrunner.parsers.base import BaseParser
 
 
+@lru_cache(maxsize=128)
+def _section_key(name: str) -> str:
+    """
+    Normalize a section name to its snake_case metadata key.
+    
+    Args:
+        name: Section name without brackets, e.g. "BCLConvert_Data"
+        
+    Returns:
+        Interned metadata key, e.g. "bclconvert_data"
+    """
+    return sys.intern(name.lower().replace(' ', '_'))
+
+
+def _read_key_values(metadata: Dict[str, Any], key: str, rows: List[List[str]]) -> None:
+    """
+    Read a key-value section from the first two columns of each row.
+    
+    Args:
+        metadata: Dictionary to update with the section
+        key: Metadata key of the section
+        rows: Rows of the section
+    """
+    metadata[key] = {row[0]: row[1] for row in rows if len(row) >= 2}
+
+
+def _read_table(metadata: Dict[str, Any], key: str, rows: List[List[str]]) -> None:
+    """
+    Read a tabular section whose first row is the column header.
+    
+    Column names are interned so every sample dict shares key objects with
+    the string literals used to look them up, e.g. 'Sample_Project'.
+    
+    Args:
+        metadata: Dictionary to update with the section and its header
+        key: Metadata key of the section
+        rows: Rows of the section
+        
+    Raises:
+        ValueError: If a row does not have as many columns as the header
+    """
+    if not rows:
+        metadata[key] = []
+        return
+    
+    header = list(map(sys.intern, rows[0]))
+    width = len(header)
+    metadata[sys.intern(f'{key}_header')] = header
+    for number, row in enumerate(rows[1:], 1):
+        if len(row) != width:
+            raise ValueError(f"Row {number} of section '{key}' has {len(row)} "
+                             f"columns, expected {width}")
+    metadata[key] = [dict(zip(header, row)) for row in rows[1:]]
+
+
+def _read_cycles(metadata: Dict[str, Any], key: str, rows: List[List[str]]) -> None:
+    """
+    Read a v1 Reads section, one cycle count per row.
+    
+    Args:
+        metadata: Dictionary to update with the section
+        key: Metadata key of the section
+        rows: Rows of the section
+    """
+    metadata[key] = [int(row[0]) for row in rows if row[0].isdigit()]
+
+
+SectionHandler = Callable[[Dict[str, Any], str, List[List[str]]], None]
+
+
 class SampleSheetParser(BaseParser):
     """Parser for SampleSheet files."""
     
-    def parse(self, file_path: str) -> Dict[str, Any]:
+    # Sections (and the data header) each SampleSheet version must contain
+    V1_SECTIONS = frozenset({'header', 'reads', 'settings', 'data', 'data_header'})
+    V2_SECTIONS = frozenset({'header', 'reads', 'bclconvert_settings', 'bclconvert_data',
+                             'bclconvert_data_header'})
+    
+    # Section readers by section key; any other section is read as a table if
+    # its name ends in "_Data" and as key-value pairs otherwise
+    V1_HANDLERS: Dict[str, SectionHandler] = {
+        'header': _read_key_values,
+        'reads': _read_cycles,
+        'settings': _read_key_values,
+        'data': _read_table,
+    }
+    V2_HANDLERS: Dict[str, SectionHandler] = {
+        'header': _read_key_values,
+        'reads': _read_key_values,
+        'bclconvert_settings': _read_key_values,
+        'bclconvert_data': _read_table,
+        'cloud_settings': _read_key_values,
+        'cloud_data': _read_table,
+    }
+    
+    def parse_bytes(self, data: bytes) -> Dict[str, Any]:
         """
-        Parse a SampleSheet file and extract metadata.
+        Extract metadata from the content of a SampleSheet file.
         
         Args:
-            file_path: Path to the SampleSheet file
+            data: Raw SampleSheet content
             
         Returns:
             Dictionary of extracted metadata
         """
+        # Decode with the same encoding and newline handling as open()
+        text = io.TextIOWrapper(io.BytesIO(data)).read()
+        
         # Determine the SampleSheet version
-        version = self._determine_version(file_path)
+        version = self._determine_version(text)
         
         if version == 1:
-            return self._parse_v1(file_path)
+            return self._parse_v1(text)
         elif version == 2:
-            return self._parse_v2(file_path)
+            return self._parse_v2(text)
         else:
             return {}
     
-    def _determine_version(self, file_path: str) -> int:
+    def _determine_version(self, text: str) -> int:
         """
         Determine the SampleSheet version.
         
         Args:
-            file_path: Path to the SampleSheet file
+            text: SampleSheet content
             
         Returns:
             SampleSheet version (1 or 2)
         """
-        with open(file_path, 'r') as f:
-            first_line = f.readline().strip()
-            
-            # Check for v2 format
-            if first_line == '[Header]' and 'FileFormatVersion' in f.readline():
+        # Only the first two lines are looked at; avoid splitting (and copying) the rest
+        first_end = text.find('\n')
+        
+        # Check for v2 format
+        if first_end != -1 and text[:first_end].strip() == '[Header]':
+            second_end = text.find('\n', first_end + 1)
+            if 'FileFormatVersion' in text[first_end + 1:second_end if second_end != -1 else None]:
                 return 2
+        
+        # Default to v1 format
+        return 1
+    
+    def _read_sections(self, text: str) -> Dict[str, List[List[str]]]:
+        """
+        Split SampleSheet content into the rows of each section.
+        
+        The content is read in a single pass; a row whose first cell is
+        "[Name]" switches the current section and every following row is
+        appended to it directly. The csv module is only needed when the
+        content contains quoted cells.
+        
+        Args:
+            text: SampleSheet content
+            
+        Returns:
+            Dictionary mapping section keys to their non-empty rows, in file order
+        """
+        sections: Dict[str, List[List[str]]] = {}
+        # Rows before the first section header are collected here and dropped
+        rows: List[List[str]] = []
+        
+        reader: Iterable[List[str]]
+        if '"' in text:
+            # filter(None, ...) drops blank rows without a Python-level check
+            reader = filter(None, csv.reader(io.StringIO(text)))
+        else:
+            # Without quotes a csv row is just its line split on commas
+            reader = map(str.split, filter(None, text.split('\n')), repeat(','))
+        
+        for row in reader:
+            if row[0][:1] == '[' and row[0][-1:] == ']':
+                rows = sections.setdefault(_section_key(row[0][1:-1]), [])
+            else:
+                rows.append(row)
+        
+        return sections
+    
+    def _parse_sections(self, text: str, metadata: Dict[str, Any],
+                        handlers: Dict[str, SectionHandler]) -> Dict[str, Any]:
+        """
+        Read every section of a SampleSheet with its handler.
+        
+        Args:
+            text: SampleSheet content
+            metadata: Metadata holding the version and default sections
+            handlers: Section handlers by section key; other sections are
+                read as tables if their key ends in "_data" and as
+                key-value pairs otherwise, unless their key is already in
+                metadata or ends in "_header"
             
-            # Default to v1 format
-            return 1
+        Returns:
+            Dictionary of extracted metadata
+        """
+        for key, rows in self._read_sections(text).items():
+            handler = handlers.get(key)
+            if handler is None:
+                # A custom section must not replace the version, a default
+                # section or the column header of a table
+                if key in metadata or key.endswith('_header'):
+                    continue
+                handler = _read_table if key.endswith('_data') else _read_key_values
+            handler(metadata, key, rows)
+        
+        return metadata
     
-    def _parse_v1(self, file_path: str) -> Dict[str, Any]:
+    def _parse_v1(self, text: str) -> Dict[str, Any]:
         """
-        Parse a v1 SampleSheet file.
+        Parse a v1 SampleSheet.
         
         Args:
-            file_path: Path to the SampleSheet file
+            text: SampleSheet content
             
         Returns:
             Dictionary of extracted metadata
@@ -68,55 +231,14 @@ class SampleSheetParser(BaseParser):
             'settings': {},
             'data': []
         }
-        
-        current_section = None
-        
-        with open(file_path, 'r') as f:
-            reader = csv.reader(f)
-            
-            for row in reader:
-                if not row:
-                    continue
-                
-                # Check for section headers
-                if row[0].startswith('[') and row[0].endswith(']'):
-                    current_section = row[0][1:-1].lower()
-                    continue
-                
-                # Process sections
-                if current_section == 'header':
-                    if len(row) >= 2:
-                        metadata['header'][row[0]] = row[1]
-                
-                elif current_section == 'reads':
-                    if row[0].isdigit():
-                        metadata['reads'].append(int(row[0]))
-                
-                elif current_section == 'settings':
-                    if len(row) >= 2:
-                        metadata['settings'][row[0]] = row[1]
-                
-                elif current_section == 'data':
-                    # First row is the header
-                    if 'data_header' not in metadata:
-                        metadata['data_header'] = row
-                        continue
-                    
-                    # Create a dictionary for the sample
-                    if len(row) == len(metadata['data_header']):
-                        sample = {}
-                        for i, header in enumerate(metadata['data_header']):
-                            sample[header] = row[i]
-                        metadata['data'].append(sample)
-        
-        return metadata
+        return self._parse_sections(text, metadata, self.V1_HANDLERS)
     
-    def _parse_v2(self, file_path: str) -> Dict[str, Any]:
+    def _parse_v2(self, text: str) -> Dict[str, Any]:
         """
-        Parse a v2 SampleSheet file.
+        Parse a v2 SampleSheet.
         
         Args:
-            file_path: Path to the SampleSheet file
+            text: SampleSheet content
             
         Returns:
             Dictionary of extracted metadata
@@ -128,122 +250,63 @@ class SampleSheetParser(BaseParser):
             'bclconvert_settings': {},
             'bclconvert_data': []
         }
-        
-        current_section = None
-        
-        with open(file_path, 'r') as f:
-            reader = csv.reader(f)
-            
-            for row in reader:
-                if not row:
-                    continue
-                
-                # Check for section headers
-                if row[0].startswith('[') and row[0].endswith(']'):
-                    current_section = row[0][1:-1].lower()
-                    continue
-                
-                # Process sections
-                if current_section == 'header':
-                    if len(row) >= 2:
-                        metadata['header'][row[0]] = row[1]
-                
-                elif current_section == 'reads':
-                    if len(row) >= 2:
-                        metadata['reads'][row[0]] = row[1]
-                
-                elif current_section == 'bclconvert_settings':
-                    if len(row) >= 2:
-                        metadata['bclconvert_settings'][row[0]] = row[1]
-                
-                elif current_section == 'bclconvert_data':
-                    # First row is the header
-                    if 'bclconvert_data_header' not in metadata:
-                        metadata['bclconvert_data_header'] = row
-                        continue
-                    
-                    # Create a dictionary for the sample
-                    if len(row) == len(metadata['bclconvert_data_header']):
-                        sample = {}
-                        for i, header in enumerate(metadata['bclconvert_data_header']):
-                            sample[header] = row[i]
-                        metadata['bclconvert_data'].append(sample)
-        
-        return metadata
+        return self._parse_sections(text, metadata, self.V2_HANDLERS)
     
-    def validate(self, metadata: Dict[str, Any]) -> bool:
+    def validate(self, metadata: Dict[str, Any], *, missing: AbstractSet[str] = frozenset()) -> bool:
         """
         Validate the extracted metadata.
         
         Args:
             metadata: Dictionary of metadata to validate
+            missing: Fields to treat as absent from the metadata
             
         Returns:
             True if the metadata is valid, False otherwise
         """
-        # Check for version
-        if 'version' not in metadata:
-            return False
-        
-        # Validate based on version
-        if metadata['version'] == 1:
-            return self._validate_v1(metadata)
-        elif metadata['version'] == 2:
-            return self._validate_v2(metadata)
+        # Validate based on version; a missing version fails both checks
+        version = metadata.get('version')
+        if version == 1:
+            return self._validate_v1(metadata, missing)
+        elif version == 2:
+            return self._validate_v2(metadata, missing)
         
         return False
     
-    def _validate_v1(self, metadata: Dict[str, Any]) -> bool:
+    def _validate_v1(self, metadata: Dict[str, Any], missing: AbstractSet[str]) -> bool:
         """
         Validate v1 SampleSheet metadata.
         
         Args:
             metadata: Dictionary of metadata to validate
+            missing: Sections to treat as absent from the metadata
             
         Returns:
             True if the metadata is valid, False otherwise
         """
-        # Check for required sections
-        required_sections = ['header', 'reads', 'settings', 'data']
-        for section in required_sections:
-            if section not in metadata:
-                return False
-        
-        # Check for data header
-        if 'data_header' not in metadata:
+        # Check for samples first: it is the cheapest check and the most common failure
+        if 'data' in missing or not metadata.get('data'):
             return False
         
-        # Check for samples
-        if not metadata['data']:
-            return False
-        
-        return True
+        # Check for required sections and the data header
+        return self.V1_SECTIONS <= metadata.keys() and self.V1_SECTIONS.isdisjoint(missing)
     
-    def _validate_v2(self, metadata: Dict[str, Any]) -> bool:
+    def _validate_v2(self, metadata: Dict[str, Any], missing: AbstractSet[str]) -> bool:
         """
         Validate v2 SampleSheet metadata.
         
         Args:
             metadata: Dictionary of metadata to validate
+            missing: Sections to treat as absent from the metadata
             
         Returns:
             True if the metadata is valid, False otherwise
         """
-        # Check for required sections
-        required_sections = ['header', 'reads', 'bclconvert_settings', 'bclconvert_data']
-        for section in required_sections:
-            if section not in metadata:
-                return False
-        
-        # Check for data header
-        if 'bclconvert_data_header' not in metadata:
-            return False
-        
-        # Check for samples
-        if not metadata['bclconvert_data']:
+        # Check for samples first: it is the cheapest check and the most common failure
+        if 'bclconvert_data' in missing or not metadata.get('bclconvert_data'):
             return False
         
-        return True
+        # Check for required sections and the data header
+        return self.V2_SECTIONS <= metadata.keys() and self.V2_SECTIONS.isdisjoint(missing)
     
     def get_samples(self, metadata: Dict[str, Any]) -> List[Dict[str, str]]:
         """
@@ -1,8 +1,10 @@
 """
 Metadata enhancement workflows.
 """
-from typing import Dict, List, Optional, Union, Any
+from typing import Dict, List, Optional, Type, Union, Any
+from enum import Enum
 import os
+import tempfile
 
 from prefect import flow, task, get_run_logger
 from prefect.context import get_run_context
@@ -10,12 +12,166 @@ from prefect.context import get_run_context
 from rodrunner.models.config import AppConfig
 from rodrunner.irods.client import iRODSClient
 from rodrunner.irods.query import QueryOperations
+from rodrunner.parsers.base import BaseParser
+from rodrunner.parsers.exceptions import ParserError
+from rodrunner.parsers.runinfo import RunInfoParser
+from rodrunner.parsers.runparameters import RunParametersParser
+from rodrunner.parsers.samplesheet import SampleSheetParser
 from rodrunner.tasks.irods import (
     create_irods_client, update_metadata_on_irods_object,
     query_collections_by_metadata
 )
 
 
+class MetadataErrorCode(str, Enum):
+    """Enum for the reasons a run metadata update can fail."""
+    NOT_FOUND = "not_found"
+    INVALID_TYPE = "invalid_type"
+    MISSING_FILES = "missing_files"
+    PARSE_ERROR = "parse_error"
+
+
+# Sequencer types whose runs carry the Illumina metadata files below
+SUPPORTED_SEQUENCER_TYPES = ('miseq', 'novaseq')
+
+# Metadata files a run collection must hold, with the parser for each
+RUN_METADATA_PARSERS: Dict[str, Type[BaseParser]] = {
+    'RunInfo.xml': RunInfoParser,
+    'RunParameters.xml': RunParametersParser,
+    'SampleSheet.csv': SampleSheetParser,
+}
+
+# Files whose parsed metadata is used even when it does not validate;
+# RunParameters.xml only adds descriptive fields, which may be incomplete
+UNVALIDATED_METADATA_FILES = frozenset({'RunParameters.xml'})
+
+
+def _metadata_update_failure(
+    irods_path: str,
+    error_code: MetadataErrorCode,
+    error: str
+) -> Dict[str, Any]:
+    """
+    Build the result of a failed run metadata update.
+    
+    Args:
+        irods_path: Path to the sequencer run in iRODS
+        error_code: Machine-readable reason for the failure
+        error: Human-readable error message
+        
+    Returns:
+        Dictionary with the result of the metadata update
+    """
+    return {
+        'success': False,
+        'irods_path': irods_path,
+        'error_code': error_code,
+        'error': error
+    }
+
+
+@flow(name="Update Run Metadata")
+def update_run_metadata(
+    config: AppConfig,
+    irods_path: str,
+    sequencer_type: str
+) -> Dict[str, Any]:
+    """
+    Update metadata for a sequencer run in iRODS.
+    
+    The run's metadata files are downloaded and parsed, and the extracted
+    values are stored on the run collection. Failures are reported in the
+    result rather than raised; ``error_code`` holds a ``MetadataErrorCode``
+    so callers can branch on it without parsing ``error``.
+    
+    Args:
+        config: Application configuration
+        irods_path: Path to the sequencer run in iRODS
+        sequencer_type: Type of sequencer (miseq, novaseq, etc.)
+        
+    Returns:
+        Dictionary with the result of the metadata update
+    """
+    logger = get_run_logger()
+    
+    if sequencer_type not in SUPPORTED_SEQUENCER_TYPES:
+        return _metadata_update_failure(
+            irods_path, MetadataErrorCode.INVALID_TYPE,
+            f"Invalid sequencer type: {sequencer_type}"
+        )
+    
+    # Create iRODS client
+    client = create_irods_client(config.irods)
+    
+    if not client.collection_exists(irods_path):
+        return _metadata_update_failure(
+            irods_path, MetadataErrorCode.NOT_FOUND,
+            f"Collection not found: {irods_path}"
+        )
+    
+    missing = [
+        name for name in RUN_METADATA_PARSERS
+        if not client.data_object_exists(f"{irods_path}/{name}")
+    ]
+    if missing:
+        return _metadata_update_failure(
+            irods_path, MetadataErrorCode.MISSING_FILES,
+            f"Missing required files: {', '.join(missing)}"
+        )
+    
+    # Download and parse the metadata files
+    logger.info(f"Extracting metadata from {irods_path}")
+    parsed: Dict[str, Dict[str, Any]] = {}
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        for name, parser_class in RUN_METADATA_PARSERS.items():
+            local_path = client.download_file(f"{irods_path}/{name}", os.path.join(tmp_dir, name))
+            parser = parser_class()
+            try:
+                file_metadata = parser.parse(local_path)
+            except (ParserError, ValueError) as e:
+                logger.error(f"Error parsing {name}: {str(e)}")
+                return _metadata_update_failure(
+                    irods_path, MetadataErrorCode.PARSE_ERROR,
+                    f"Failed to parse {name}: {str(e)}"
+                )
+            
+            if name not in UNVALIDATED_METADATA_FILES and not parser.validate(file_metadata):
+                return _metadata_update_failure(
+                    irods_path, MetadataErrorCode.PARSE_ERROR,
+                    f"Failed to parse {name}: missing required fields"
+                )
+            parsed[name] = file_metadata
+    
+    run_info = parsed['RunInfo.xml']
+    run_parameters = parsed['RunParameters.xml']
+    sample_sheet = parsed['SampleSheet.csv']
+    metadata = {
+        'run_id': run_info.get('run_id', ''),
+        'instrument': run_info.get('instrument', ''),
+        'flowcell': run_info.get('flowcell', ''),
+        'date': run_info.get('date', ''),
+        'rta_version': run_parameters.get('rta_version', ''),
+        'chemistry': run_parameters.get('chemistry', ''),
+        'sample_count': str(len(SampleSheetParser().get_samples(sample_sheet))),
+        'status': 'metadata_extracted'
+    }
+    
+    # Update metadata
+    logger.info(f"Updating metadata for {irods_path}")
+    update_metadata_on_irods_object(
+        client=client,
+        path=irods_path,
+        metadata=metadata,
+        object_type='collection'
+    )
+    
+    return {
+        'success': True,
+        'irods_path': irods_path,
+        'metadata': metadata
+    }
+
+
 @flow(name="Update Run Status")
 def update_run_status(
     config: AppConfig,
@@ -2,12 +2,15 @@
 Common test fixtures for the rodrunner package.
 """
 import os
+import re
 import tempfile
 import shutil
-from typing import Dict, Generator, Any
+import uuid
+from typing import AsyncGenerator, Dict, Generator, Any
 
 import pytest
 from fastapi.testclient import TestClient
+from httpx import ASGITransport, AsyncClient
 
 from rodrunner.models.config import AppConfig
 from rodrunner.config import get_config
@@ -23,16 +26,48 @@ def temp_dir() -> Generator[str, None, None]:
     shutil.rmtree(temp_dir)
 
 
+@pytest.fixture
+def small_file(tmp_path) -> str:
+    """Create a small file with known content in a per-test temporary directory."""
+    file_path = tmp_path / "small_file.txt"
+    file_path.write_bytes(b"Test content")
+    return str(file_path)
+
+
 @pytest.fixture
 def app_config() -> AppConfig:
     """Get the application configuration from environment variables or config file."""
     return get_config()
 
 
+@pytest.fixture(scope="session")
+def irods_client() -> Generator[iRODSClient, None, None]:
+    """Create an iRODS client that reuses one persistent session for the whole test run."""
+    client = iRODSClient(get_config().irods)
+    client.open_session()
+    yield client
+    client.close_session()
+
+
 @pytest.fixture
-def irods_client(app_config: AppConfig) -> iRODSClient:
-    """Create an iRODS client using the application configuration."""
-    return iRODSClient(app_config.irods)
+def irods_test_prefix() -> str:
+    """
+    Prefix for iRODS test collections.
+    
+    Includes the pytest-xdist worker id and the process id so that tests running
+    on parallel workers never share a collection.
+    """
+    worker = os.environ.get("PYTEST_XDIST_WORKER", "gw0")
+    return f"/tempZone/home/rods/test_{worker}_{os.getpid()}"
+
+
+@pytest.fixture
+def test_collection(irods_client: iRODSClient, irods_test_prefix: str) -> Generator[str, None, None]:
+    """Create a uniquely named iRODS collection for a test and remove it afterwards."""
+    path = f"{irods_test_prefix}_{uuid.uuid4().hex}"
+    irods_client.create_collection(path)
+    yield path
+    irods_client.remove_collection(path, recursive=True)
 
 
 @pytest.fixture
@@ -43,6 +78,20 @@ def api_client(app_config: AppConfig) -> TestClient:
 
 
 @pytest.fixture
+def anyio_backend() -> str:
+    """Run anyio-marked tests on asyncio only."""
+    return "asyncio"
+
+
+@pytest.fixture
+async def async_api_client(app_config: AppConfig) -> AsyncGenerator[AsyncClient, None]:
+    """Create an async HTTP client that calls the FastAPI application in-process."""
+    app = create_app(app_config)
+    async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as client:
+        yield client
+
+
+@pytest.fixture(scope="session")
 def sample_run_info_xml() -> str:
     """Sample RunInfo.xml content for testing."""
     return """<?xml version="1.0"?>
@@ -63,7 +112,7 @@ def sample_run_info_xml() -> str:
 """
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_run_parameters_xml() -> str:
     """Sample RunParameters.xml content for testing."""
     return """<?xml version="1.0"?>
@@ -82,7 +131,7 @@ def sample_run_parameters_xml() -> str:
 """
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_samplesheet_csv() -> str:
     """Sample SampleSheet.csv content for testing."""
     return """[Header]
@@ -110,24 +159,63 @@ Sample2,Sample2,Plate1,A02,A02,N702,CGTACTAG,S502,CTCTCTAT,Project1,Description2
 """
 
 
-@pytest.fixture
-def sample_sequencer_run(temp_dir: str, sample_run_info_xml: str,
-                        sample_run_parameters_xml: str, sample_samplesheet_csv: str) -> str:
-    """Create a sample sequencer run directory for testing."""
-    run_dir = os.path.join(temp_dir, "220101_M00001_0001_000000000-A1B2C")
+# MiSeq values in the sample RunInfo.xml and their NovaSeq counterparts
+NOVASEQ_REPLACEMENTS = {
+    "<Instrument>M00001</Instrument>": "<Instrument>A00001</Instrument>",
+    "220101_M00001_0001_000000000-A1B2C": "220102_A00001_0001_AHGV7DRXX",
+}
+NOVASEQ_PATTERN = re.compile("|".join(map(re.escape, NOVASEQ_REPLACEMENTS)))
+
+
+@pytest.fixture(scope="session")
+def novaseq_run_info_xml(sample_run_info_xml: str) -> str:
+    """Sample RunInfo.xml content rewritten for a NovaSeq instrument and run."""
+    return NOVASEQ_PATTERN.sub(lambda match: NOVASEQ_REPLACEMENTS[match.group()], sample_run_info_xml)
+
+
+@pytest.fixture(scope="session")
+def sample_run_name() -> str:
+    """Name of the sample sequencer run directory."""
+    return "220101_M00001_0001_000000000-A1B2C"
+
+
+def _write_sequencer_run(run_dir: str, run_info_xml: str, run_parameters_xml: str,
+                         samplesheet_csv: str) -> None:
+    """Create a sequencer run directory with all required files."""
     os.makedirs(run_dir)
 
     # Create required files
     with open(os.path.join(run_dir, "RunInfo.xml"), "w") as f:
-        f.write(sample_run_info_xml)
+        f.write(run_info_xml)
 
     with open(os.path.join(run_dir, "RunParameters.xml"), "w") as f:
-        f.write(sample_run_parameters_xml)
+        f.write(run_parameters_xml)
 
     with open(os.path.join(run_dir, "SampleSheet.csv"), "w") as f:
-        f.write(sample_samplesheet_csv)
+        f.write(samplesheet_csv)
 
     with open(os.path.join(run_dir, "RTAComplete.txt"), "w") as f:
         f.write("RTA Complete")
 
+
+@pytest.fixture
+def sample_sequencer_run(temp_dir: str, sample_run_name: str, sample_run_info_xml: str,
+                        sample_run_parameters_xml: str, sample_samplesheet_csv: str) -> str:
+    """Create a sample sequencer run directory for testing."""
+    run_dir = os.path.join(temp_dir, sample_run_name)
+    _write_sequencer_run(run_dir, sample_run_info_xml, sample_run_parameters_xml, sample_samplesheet_csv)
+    return run_dir
+
+
+@pytest.fixture(scope="session")
+def prepared_miseq_template(tmp_path_factory, sample_run_name: str, sample_run_info_xml: str,
+                            sample_run_parameters_xml: str, sample_samplesheet_csv: str) -> str:
+    """
+    Create the sample sequencer run once per session as a read-only template.
+
+    Clone it with tests.test_workflows._util.hardlink_tree(prepared_miseq_template, dst);
+    clones may remove files but must not write to them, since the data is shared.
+    """
+    run_dir = os.path.join(str(tmp_path_factory.mktemp("template")), sample_run_name)
+    _write_sequencer_run(run_dir, sample_run_info_xml, sample_run_parameters_xml, sample_samplesheet_csv)
     return run_dir
@@ -6,6 +6,7 @@ import pytest
 import tempfile
 import json
 import time
+from contextlib import suppress
 from typing import Dict, Any
 from concurrent.futures import ThreadPoolExecutor
 
@@ -93,8 +94,7 @@ def test_metadata_search_with_special_characters(api_client: TestClient, irods_c
     
     finally:
         # Clean up
-        if irods_client.collection_exists(test_coll_name):
-            irods_client.remove_collection(test_coll_name)
+        irods_client.remove_collection(test_coll_name)
 
 
 @pytest.mark.api
@@ -178,10 +178,9 @@ def test_metadata_update_with_invalid_data(api_client: TestClient, irods_client:
     
     finally:
         # Clean up
-        if os.path.exists(test_file_path):
+        with suppress(FileNotFoundError):
             os.unlink(test_file_path)
-        if irods_client.collection_exists(test_coll_name):
-            irods_client.remove_collection(test_coll_name, recursive=True)
+        irods_client.remove_collection(test_coll_name, recursive=True)
 
 
 @pytest.mark.api
@@ -291,8 +290,7 @@ def test_concurrent_api_requests(api_client: TestClient, irods_client: iRODSClie
     finally:
         # Clean up
         for test_coll_name in test_coll_names:
-            if irods_client.collection_exists(test_coll_name):
-                irods_client.remove_collection(test_coll_name)
+            irods_client.remove_collection(test_coll_name)
 
 
 @pytest.mark.api
@@ -346,8 +344,7 @@ def test_large_metadata_response(api_client: TestClient, irods_client: iRODSClie
     
     finally:
         # Clean up
-        if irods_client.collection_exists(test_coll_name):
-            irods_client.remove_collection(test_coll_name)
+        irods_client.remove_collection(test_coll_name)
 
 
 @pytest.mark.api
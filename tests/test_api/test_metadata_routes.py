@@ -3,6 +3,7 @@ Tests for the metadata API routes.
 """
 import os
 import pytest
+from contextlib import suppress
 from typing import Dict, Any
 import json
 
@@ -56,8 +57,7 @@ def test_get_metadata_by_key(api_client: TestClient, irods_client: iRODSClient)
     
     finally:
         # Clean up
-        if irods_client.collection_exists(test_coll_name):
-            irods_client.remove_collection(test_coll_name)
+        irods_client.remove_collection(test_coll_name)
 
 
 @pytest.mark.api
@@ -98,10 +98,9 @@ def test_get_object_metadata(api_client: TestClient, irods_client: iRODSClient,
     
     finally:
         # Clean up
-        if os.path.exists(test_file_path):
+        with suppress(FileNotFoundError):
             os.unlink(test_file_path)
-        if irods_client.collection_exists(test_coll_name):
-            irods_client.remove_collection(test_coll_name, recursive=True)
+        irods_client.remove_collection(test_coll_name, recursive=True)
 
 
 @pytest.mark.api
@@ -153,7 +152,6 @@ def test_update_metadata(api_client: TestClient, irods_client: iRODSClient, temp
     
     finally:
         # Clean up
-        if os.path.exists(test_file_path):
+        with suppress(FileNotFoundError):
             os.unlink(test_file_path)
-        if irods_client.collection_exists(test_coll_name):
-            irods_client.remove_collection(test_coll_name, recursive=True)
+        irods_client.remove_collection(test_coll_name, recursive=True)
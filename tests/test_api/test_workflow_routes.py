@@ -26,7 +26,8 @@ def test_list_workflows(api_client: TestClient) -> None:
 
 
 @pytest.mark.api
-def test_run_ingest_workflow(api_client: TestClient, sample_sequencer_run: str, temp_dir: str) -> None:
+def test_run_ingest_workflow(api_client: TestClient, sample_sequencer_run: str, sample_run_name: str,
+                             temp_dir: str) -> None:
     """Test running the ingest workflow via API."""
     # Set up a test directory with a sequencer run
     sequencer_dir = os.path.join(temp_dir, "sequencer_api_test")
@@ -34,8 +35,7 @@ def test_run_ingest_workflow(api_client: TestClient, sample_sequencer_run: str,
     os.makedirs(miseq_dir)
     
     # Copy the sample run to the miseq directory
-    run_name = os.path.basename(sample_sequencer_run)
-    os.system(f"cp -r {sample_sequencer_run} {miseq_dir}/{run_name}")
+    os.system(f"cp -r {sample_sequencer_run} {miseq_dir}/{sample_run_name}")
     
     # Test running the workflow
     workflow_data = {
@@ -6,14 +6,15 @@ import pytest
 import tempfile
 from typing import Dict, Any
 
-from fastapi.testclient import TestClient
+from httpx import AsyncClient
 from rodrunner.models.config import AppConfig
 
 
 @pytest.mark.api
-def test_api_root(api_client: TestClient) -> None:
+@pytest.mark.anyio
+async def test_api_root(async_api_client: AsyncClient) -> None:
     """Test the API root endpoint."""
-    response = api_client.get("/")
+    response = await async_api_client.get("/")
     assert response.status_code == 200
     data = response.json()
     assert "message" in data
@@ -21,9 +22,10 @@ def test_api_root(api_client: TestClient) -> None:
 
 
 @pytest.mark.api
-def test_api_health(api_client: TestClient) -> None:
+@pytest.mark.anyio
+async def test_api_health(async_api_client: AsyncClient) -> None:
     """Test the API health endpoint."""
-    response = api_client.get("/health")
+    response = await async_api_client.get("/health")
     assert response.status_code == 200
     data = response.json()
     assert "status" in data
@@ -0,0 +1,22 @@
+"""
+Helpers for parser tests.
+"""
+import os
+from pathlib import Path
+
+
+def write_fixture(directory: str, name: str, content: str) -> str:
+    """
+    Write a test file in one call, replacing any existing file.
+    
+    Args:
+        directory: Directory to write the file in
+        name: File name
+        content: File content
+        
+    Returns:
+        Path to the written file
+    """
+    path = os.path.join(directory, name)
+    Path(path).write_bytes(content.encode())
+    return path
@@ -0,0 +1,110 @@
+"""
+Parser test fixtures.
+"""
+import pytest
+
+from tests.test_parsers._util import write_fixture
+
+
+_INVALID_XML = "This is not valid XML"
+
+_INVALID_SAMPLESHEET = "This is not a valid SampleSheet format"
+
+_MALFORMED_RUNINFO = """<?xml version="1.0"?>
+<RunInfo Version="2">
+  <Run Id="220101_M00001_0001_000000000-A1B2C" Number="1">
+    <Flowcell>000000000-A1B2C</Flowcell>
+    <Instrument>M00001</Instrument>
+    <Date>1/1/2022</Date>
+    <Reads>
+      <Read Number="1" NumCycles="151" IsIndexedRead="N" />
+      <Read Number="2" NumCycles="8" IsIndexedRead="Y" />
+      <Read Number="3" NumCycles="8" IsIndexedRead="Y" />
+      <Read Number="4" NumCycles="151" IsIndexedRead="N" />
+    </Reads>
+    <FlowcellLayout LaneCount="1" SurfaceCount="2" SwathCount="1" TileCount="14" />
+  <!-- Missing closing Run tag -->
+</RunInfo>
+"""
+
+# The last data row is missing its Description field
+_MALFORMED_SAMPLESHEET = """[Header]
+IEMFileVersion,5
+Date,1/1/2022
+Workflow,GenerateFASTQ
+Application,FASTQ Only
+
+[Reads]
+151
+151
+
+[Settings]
+ReverseComplement,0
+Adapter,CTGTCTCTTATACACATCT
+
+[Data]
+Sample_ID,Sample_Name,Sample_Plate,Sample_Well,Index_Plate_Well,I7_Index_ID,index,I5_Index_ID,index2,Sample_Project,Description
+Sample1,Sample1,Plate1,A01,A01,N701,TAAGGCGA,S501,TAGATCGC,Project1,Description1
+Sample2,Sample2,Plate1,A02,A02,N702,CGTACTAG,S502,CTCTCTAT,Project1
+"""
+
+# No Reads or Settings sections
+_MISSING_SECTIONS_SAMPLESHEET = """[Header]
+IEMFileVersion,5
+Date,1/1/2022
+Workflow,GenerateFASTQ
+Application,FASTQ Only
+
+[Data]
+Sample_ID,Sample_Name,Sample_Plate,Sample_Well,Index_Plate_Well,I7_Index_ID,index,I5_Index_ID,index2,Sample_Project,Description
+Sample1,Sample1,Plate1,A01,A01,N701,TAAGGCGA,S501,TAGATCGC,Project1,Description1
+Sample2,Sample2,Plate1,A02,A02,N702,CGTACTAG,S502,CTCTCTAT,Project1,Description2
+"""
+
+
+@pytest.fixture(scope="module")
+def sample_run_dir(tmp_path_factory, sample_run_info_xml: str,
+                   sample_run_parameters_xml: str, sample_samplesheet_csv: str) -> str:
+    """Write the sample run files once per module; tests must treat the directory as read-only."""
+    run_dir = tmp_path_factory.mktemp("run")
+    (run_dir / "RunInfo.xml").write_text(sample_run_info_xml)
+    (run_dir / "RunParameters.xml").write_text(sample_run_parameters_xml)
+    (run_dir / "SampleSheet.csv").write_text(sample_samplesheet_csv)
+    (run_dir / "other.txt").write_text("This file should be ignored")
+    return str(run_dir)
+
+
+@pytest.fixture(scope="session")
+def blob_dir(tmp_path_factory) -> str:
+    """Directory for the constant parser inputs; written once per session and read-only."""
+    return str(tmp_path_factory.mktemp("blobs"))
+
+
+@pytest.fixture(scope="session")
+def invalid_xml_path(blob_dir: str) -> str:
+    """Path to a file that is not XML at all."""
+    return write_fixture(blob_dir, "Invalid.xml", _INVALID_XML)
+
+
+@pytest.fixture(scope="session")
+def invalid_samplesheet_path(blob_dir: str) -> str:
+    """Path to a file that is not a SampleSheet."""
+    return write_fixture(blob_dir, "InvalidSampleSheet.csv", _INVALID_SAMPLESHEET)
+
+
+@pytest.fixture(scope="session")
+def malformed_runinfo_path(blob_dir: str) -> str:
+    """Path to a RunInfo.xml whose Run element is never closed."""
+    return write_fixture(blob_dir, "MalformedRunInfo.xml", _MALFORMED_RUNINFO)
+
+
+@pytest.fixture(scope="session")
+def malformed_samplesheet_path(blob_dir: str) -> str:
+    """Path to a SampleSheet.csv with a short data row."""
+    return write_fixture(blob_dir, "MalformedSampleSheet.csv", _MALFORMED_SAMPLESHEET)
+
+
+@pytest.fixture(scope="session")
+def missing_sections_samplesheet_path(blob_dir: str) -> str:
+    """Path to a v1 SampleSheet.csv with only Header and Data sections."""
+    return write_fixture(blob_dir, "MissingSectionsSampleSheet.csv", _MISSING_SECTIONS_SAMPLESHEET)
@@ -5,6 +5,7 @@ import os
 import pytest
 from typing import Dict, Any
 
+from rodrunner.parsers import factory as factory_module
 from rodrunner.parsers.factory import ParserFactory
 from rodrunner.parsers.runinfo import RunInfoParser
 from rodrunner.parsers.runparameters import RunParametersParser
@@ -34,24 +35,13 @@ def test_parser_factory_get_parser() -> None:
 
 
 @pytest.mark.unit
-def test_parser_factory_parse_file(temp_dir: str, sample_run_info_xml: str, 
-                                 sample_run_parameters_xml: str, 
-                                 sample_samplesheet_csv: str) -> None:
+def test_parser_factory_parse_file(sample_run_dir: str) -> None:
     """Test parsing files using the factory."""
     factory = ParserFactory()
     
-    # Create test files
-    run_info_path = os.path.join(temp_dir, "RunInfo.xml")
-    with open(run_info_path, "w") as f:
-        f.write(sample_run_info_xml)
-    
-    run_parameters_path = os.path.join(temp_dir, "RunParameters.xml")
-    with open(run_parameters_path, "w") as f:
-        f.write(sample_run_parameters_xml)
-    
-    samplesheet_path = os.path.join(temp_dir, "SampleSheet.csv")
-    with open(samplesheet_path, "w") as f:
-        f.write(sample_samplesheet_csv)
+    run_info_path = os.path.join(sample_run_dir, "RunInfo.xml")
+    run_parameters_path = os.path.join(sample_run_dir, "RunParameters.xml")
+    samplesheet_path = os.path.join(sample_run_dir, "SampleSheet.csv")
     
     # Test parsing RunInfo.xml
     run_info_metadata = factory.parse_file(run_info_path)
@@ -74,31 +64,12 @@ def test_parser_factory_parse_file(temp_dir: str, sample_run_info_xml: str,
 
 
 @pytest.mark.unit
-def test_parser_factory_parse_directory(temp_dir: str, sample_run_info_xml: str, 
-                                      sample_run_parameters_xml: str, 
-                                      sample_samplesheet_csv: str) -> None:
+def test_parser_factory_parse_directory(sample_run_dir: str) -> None:
     """Test parsing a directory of files using the factory."""
     factory = ParserFactory()
     
-    # Create test files in a directory
-    run_dir = os.path.join(temp_dir, "run_dir")
-    os.makedirs(run_dir)
-    
-    with open(os.path.join(run_dir, "RunInfo.xml"), "w") as f:
-        f.write(sample_run_info_xml)
-    
-    with open(os.path.join(run_dir, "RunParameters.xml"), "w") as f:
-        f.write(sample_run_parameters_xml)
-    
-    with open(os.path.join(run_dir, "SampleSheet.csv"), "w") as f:
-        f.write(sample_samplesheet_csv)
-    
-    # Also create a file that shouldn't be parsed
-    with open(os.path.join(run_dir, "other.txt"), "w") as f:
-        f.write("This file should be ignored")
-    
     # Test parsing the directory
-    metadata = factory.parse_directory(run_dir)
+    metadata = factory.parse_directory(sample_run_dir)
     assert metadata is not None
     assert "RunInfo.xml" in metadata
     assert "RunParameters.xml" in metadata
@@ -109,3 +80,84 @@ def test_parser_factory_parse_directory(temp_dir: str, sample_run_info_xml: str,
     assert metadata["RunInfo.xml"]["run_id"] == "220101_M00001_0001_000000000-A1B2C"
     assert metadata["RunParameters.xml"]["run_id"] == "220101_M00001_0001_000000000-A1B2C"
     assert len(metadata["SampleSheet.csv"]["data"]) == 2
+
+
+@pytest.mark.unit
+def test_parser_factory_parse_directory_cache(sample_run_dir: str, tmp_path) -> None:
+    """Test that parse_directory reuses cached metadata for unchanged files."""
+    factory = ParserFactory()
+    cache_dir = str(tmp_path / "cache")
+    
+    # The first call parses every file and fills the cache
+    metadata = factory.parse_directory(sample_run_dir, cache_dir=cache_dir)
+    assert len(os.listdir(cache_dir)) == len(metadata)
+    
+    # The second call is served from the cache with identical results
+    assert factory.parse_directory(sample_run_dir, cache_dir=cache_dir) == metadata
+    assert len(os.listdir(cache_dir)) == len(metadata)
+    assert factory.parse_directory(sample_run_dir) == metadata
+
+
+@pytest.mark.unit
+def test_parser_factory_cache_version(sample_run_dir: str, tmp_path, monkeypatch) -> None:
+    """Test that bumping CACHE_VERSION stops old cache entries from being served."""
+    cache_dir = str(tmp_path / "cache")
+    run_info_path = os.path.join(sample_run_dir, "RunInfo.xml")
+    
+    old_cache_file = factory_module._cache_file(cache_dir, run_info_path)
+    monkeypatch.setattr(factory_module, "CACHE_VERSION", factory_module.CACHE_VERSION + 1)
+    assert factory_module._cache_file(cache_dir, run_info_path) != old_cache_file
+
+
+@pytest.mark.unit
+def test_parser_factory_cache_write_failure(sample_run_dir: str, tmp_path, monkeypatch) -> None:
+    """Test that a failed cache write leaves no temporary file behind."""
+    cache_dir = tmp_path / "cache"
+    
+    def fail_dumps(obj):
+        raise TypeError("not serializable")
+    
+    monkeypatch.setattr(factory_module, "_dumps", fail_dumps)
+    metadata = ParserFactory.parse_directory(sample_run_dir, cache_dir=str(cache_dir))
+    
+    # Parsing still succeeds, but nothing is cached
+    assert metadata == ParserFactory.parse_directory(sample_run_dir)
+    assert list(cache_dir.iterdir()) == []
+
+
+@pytest.mark.unit
+def test_parser_factory_parse_directory_skips_corrupt_file(tmp_path, sample_samplesheet_csv: str) -> None:
+    """Test that a file that cannot be parsed does not fail the whole directory."""
+    factory = ParserFactory()
+    
+    # A malformed RunInfo.xml next to a valid SampleSheet.csv
+    (tmp_path / "RunInfo.xml").write_text("This is not valid XML")
+    (tmp_path / "SampleSheet.csv").write_text(sample_samplesheet_csv)
+    
+    metadata = factory.parse_directory(str(tmp_path))
+    assert "RunInfo.xml" not in metadata
+    assert len(metadata["SampleSheet.csv"]["data"]) == 2
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize("use_cache", [False, True])
+def test_parser_factory_parse_directory_skips_unreadable_file(tmp_path, monkeypatch, use_cache: bool,
+                                                               sample_run_info_xml: str,
+                                                               sample_samplesheet_csv: str) -> None:
+    """Test that a file that cannot be read does not fail the whole directory."""
+    factory = ParserFactory()
+    
+    run_dir = tmp_path / "run"
+    run_dir.mkdir()
+    (run_dir / "RunInfo.xml").write_text(sample_run_info_xml)
+    (run_dir / "SampleSheet.csv").write_text(sample_samplesheet_csv)
+    
+    def deny(self, file_path: str) -> Dict[str, Any]:
+        raise PermissionError(f"Permission denied: {file_path}")
+    
+    monkeypatch.setattr(RunInfoParser, "get_metadata", deny)
+    
+    cache_dir = str(tmp_path / "cache") if use_cache else None
+    metadata = factory.parse_directory(str(run_dir), cache_dir=cache_dir)
+    assert "RunInfo.xml" not in metadata
+    assert len(metadata["SampleSheet.csv"]["data"]) == 2
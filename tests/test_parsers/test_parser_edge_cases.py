@@ -11,43 +11,23 @@ from rodrunner.parsers.runparameters import RunParametersParser
 from rodrunner.parsers.samplesheet import SampleSheetParser
 from rodrunner.parsers.factory import ParserFactory
 
+from tests.test_parsers._util import write_fixture
+
 
 @pytest.mark.unit
-def test_runinfo_parser_malformed_xml(temp_dir: str) -> None:
+def test_runinfo_parser_malformed_xml(malformed_runinfo_path: str) -> None:
     """Test parsing malformed RunInfo.xml."""
-    # Create a malformed XML file
-    malformed_xml_path = os.path.join(temp_dir, "MalformedRunInfo.xml")
-    with open(malformed_xml_path, "w") as f:
-        f.write("""<?xml version="1.0"?>
-<RunInfo Version="2">
-  <Run Id="220101_M00001_0001_000000000-A1B2C" Number="1">
-    <Flowcell>000000000-A1B2C</Flowcell>
-    <Instrument>M00001</Instrument>
-    <Date>1/1/2022</Date>
-    <Reads>
-      <Read Number="1" NumCycles="151" IsIndexedRead="N" />
-      <Read Number="2" NumCycles="8" IsIndexedRead="Y" />
-      <Read Number="3" NumCycles="8" IsIndexedRead="Y" />
-      <Read Number="4" NumCycles="151" IsIndexedRead="N" />
-    </Reads>
-    <FlowcellLayout LaneCount="1" SurfaceCount="2" SwathCount="1" TileCount="14" />
-  <!-- Missing closing Run tag -->
-</RunInfo>
-""")
-    
     # Parse the file
     parser = RunInfoParser()
     with pytest.raises(Exception):
-        parser.parse(malformed_xml_path)
+        parser.parse(malformed_runinfo_path)
 
 
 @pytest.mark.unit
 def test_runinfo_parser_incomplete_xml(temp_dir: str) -> None:
     """Test parsing incomplete RunInfo.xml."""
     # Create an incomplete XML file
-    incomplete_xml_path = os.path.join(temp_dir, "IncompleteRunInfo.xml")
-    with open(incomplete_xml_path, "w") as f:
-        f.write("""<?xml version="1.0"?>
+    incomplete_xml_path = write_fixture(temp_dir, "IncompleteRunInfo.xml", """<?xml version="1.0"?>
 <RunInfo Version="2">
   <Run Id="220101_M00001_0001_000000000-A1B2C" Number="1">
     <!-- Missing required elements -->
@@ -74,9 +54,7 @@ def test_runinfo_parser_incomplete_xml(temp_dir: str) -> None:
 def test_runinfo_parser_extra_elements(temp_dir: str) -> None:
     """Test parsing RunInfo.xml with extra elements."""
     # Create an XML file with extra elements
-    extra_elements_xml_path = os.path.join(temp_dir, "ExtraElementsRunInfo.xml")
-    with open(extra_elements_xml_path, "w") as f:
-        f.write("""<?xml version="1.0"?>
+    extra_elements_xml_path = write_fixture(temp_dir, "ExtraElementsRunInfo.xml", """<?xml version="1.0"?>
 <RunInfo Version="2">
   <Run Id="220101_M00001_0001_000000000-A1B2C" Number="1">
     <Flowcell>000000000-A1B2C</Flowcell>
@@ -123,9 +101,7 @@ def test_runinfo_parser_extra_elements(temp_dir: str) -> None:
 def test_runparameters_parser_different_formats(temp_dir: str) -> None:
     """Test parsing different formats of RunParameters.xml."""
     # Create a MiSeq format RunParameters.xml
-    miseq_xml_path = os.path.join(temp_dir, "MiSeqRunParameters.xml")
-    with open(miseq_xml_path, "w") as f:
-        f.write("""<?xml version="1.0"?>
+    miseq_xml_path = write_fixture(temp_dir, "MiSeqRunParameters.xml", """<?xml version="1.0"?>
 <RunParameters>
   <RunParametersVersion>MiSeq_1_0</RunParametersVersion>
   <Setup>
@@ -141,9 +117,7 @@ def test_runparameters_parser_different_formats(temp_dir: str) -> None:
 """)
     
     # Create a NextSeq format RunParameters.xml
-    nextseq_xml_path = os.path.join(temp_dir, "NextSeqRunParameters.xml")
-    with open(nextseq_xml_path, "w") as f:
-        f.write("""<?xml version="1.0"?>
+    nextseq_xml_path = write_fixture(temp_dir, "NextSeqRunParameters.xml", """<?xml version="1.0"?>
 <RunParameters>
   <Setup>
     <ApplicationName>NextSeq Control Software</ApplicationName>
@@ -158,9 +132,7 @@ def test_runparameters_parser_different_formats(temp_dir: str) -> None:
 """)
     
     # Create a NovaSeq format RunParameters.xml
-    novaseq_xml_path = os.path.join(temp_dir, "NovaSeqRunParameters.xml")
-    with open(novaseq_xml_path, "w") as f:
-        f.write("""<?xml version="1.0"?>
+    novaseq_xml_path = write_fixture(temp_dir, "NovaSeqRunParameters.xml", """<?xml version="1.0"?>
 <RunParameters>
   <Setup>
     <ApplicationName>NovaSeq Control Software</ApplicationName>
@@ -208,58 +180,20 @@ def test_runparameters_parser_different_formats(temp_dir: str) -> None:
 
 
 @pytest.mark.unit
-def test_samplesheet_parser_malformed_csv(temp_dir: str) -> None:
+def test_samplesheet_parser_malformed_csv(malformed_samplesheet_path: str) -> None:
     """Test parsing malformed SampleSheet.csv."""
-    # Create a malformed CSV file
-    malformed_csv_path = os.path.join(temp_dir, "MalformedSampleSheet.csv")
-    with open(malformed_csv_path, "w") as f:
-        f.write("""[Header]
-IEMFileVersion,5
-Date,1/1/2022
-Workflow,GenerateFASTQ
-Application,FASTQ Only
-
-[Reads]
-151
-151
-
-[Settings]
-ReverseComplement,0
-Adapter,CTGTCTCTTATACACATCT
-
-[Data]
-Sample_ID,Sample_Name,Sample_Plate,Sample_Well,Index_Plate_Well,I7_Index_ID,index,I5_Index_ID,index2,Sample_Project,Description
-Sample1,Sample1,Plate1,A01,A01,N701,TAAGGCGA,S501,TAGATCGC,Project1,Description1
-Sample2,Sample2,Plate1,A02,A02,N702,CGTACTAG,S502,CTCTCTAT,Project1
-""")  # Missing a field in the last line
-    
     # Parse the file
     parser = SampleSheetParser()
     with pytest.raises(Exception):
-        parser.parse(malformed_csv_path)
+        parser.parse(malformed_samplesheet_path)
 
 
 @pytest.mark.unit
-def test_samplesheet_parser_missing_sections(temp_dir: str) -> None:
+def test_samplesheet_parser_missing_sections(missing_sections_samplesheet_path: str) -> None:
     """Test parsing SampleSheet.csv with missing sections."""
-    # Create a CSV file with missing sections
-    missing_sections_csv_path = os.path.join(temp_dir, "MissingSectionsSampleSheet.csv")
-    with open(missing_sections_csv_path, "w") as f:
-        f.write("""[Header]
-IEMFileVersion,5
-Date,1/1/2022
-Workflow,GenerateFASTQ
-Application,FASTQ Only
-
-[Data]
-Sample_ID,Sample_Name,Sample_Plate,Sample_Well,Index_Plate_Well,I7_Index_ID,index,I5_Index_ID,index2,Sample_Project,Description
-Sample1,Sample1,Plate1,A01,A01,N701,TAAGGCGA,S501,TAGATCGC,Project1,Description1
-Sample2,Sample2,Plate1,A02,A02,N702,CGTACTAG,S502,CTCTCTAT,Project1,Description2
-""")  # Missing Reads and Settings sections
-    
     # Parse the file
     parser = SampleSheetParser()
-    metadata = parser.parse(missing_sections_csv_path)
+    metadata = parser.parse(missing_sections_samplesheet_path)
     
     # Verify parsed metadata
     assert "header" in metadata
@@ -277,9 +211,7 @@ Sample2,Sample2,Plate1,A02,A02,N702,CGTACTAG,S502,CTCTCTAT,Project1,Description2
 def test_samplesheet_parser_empty_sections(temp_dir: str) -> None:
     """Test parsing SampleSheet.csv with empty sections."""
     # Create a CSV file with empty sections
-    empty_sections_csv_path = os.path.join(temp_dir, "EmptySectionsSampleSheet.csv")
-    with open(empty_sections_csv_path, "w") as f:
-        f.write("""[Header]
+    empty_sections_csv_path = write_fixture(temp_dir, "EmptySectionsSampleSheet.csv", """[Header]
 IEMFileVersion,5
 Date,1/1/2022
 
@@ -313,9 +245,7 @@ Sample_ID,Sample_Name,Sample_Plate,Sample_Well,Index_Plate_Well,I7_Index_ID,inde
 def test_samplesheet_v2_parser_edge_cases(temp_dir: str) -> None:
     """Test parsing edge cases for SampleSheet v2 format."""
     # Create a SampleSheet v2 with missing sections
-    missing_sections_v2_path = os.path.join(temp_dir, "MissingSectionsV2.csv")
-    with open(missing_sections_v2_path, "w") as f:
-        f.write("""[Header]
+    missing_sections_v2_path = write_fixture(temp_dir, "MissingSectionsV2.csv", """[Header]
 FileFormatVersion,2
 RunName,Test Run
 InstrumentPlatform,NextSeq 2000
@@ -345,9 +275,7 @@ Sample2,CGATGTTT,AAACATCG
     assert parser.validate(metadata) is True
     
     # Create a SampleSheet v2 with extra sections
-    extra_sections_v2_path = os.path.join(temp_dir, "ExtraSectionsV2.csv")
-    with open(extra_sections_v2_path, "w") as f:
-        f.write("""[Header]
+    extra_sections_v2_path = write_fixture(temp_dir, "ExtraSectionsV2.csv", """[Header]
 FileFormatVersion,2
 RunName,Test Run
 InstrumentPlatform,NextSeq 2000
@@ -404,6 +332,58 @@ CustomKey2,CustomValue2
     assert parser.validate(metadata) is True
 
 
+@pytest.mark.unit
+def test_samplesheet_parser_custom_sections(temp_dir: str) -> None:
+    """Test that custom SampleSheet sections do not replace parsed metadata."""
+    parser = SampleSheetParser()
+    
+    # Create a SampleSheet v2 with sections that collide with parsed keys
+    custom_sections_v2_path = write_fixture(temp_dir, "CustomSectionsV2.csv", """[Header]
+FileFormatVersion,2
+RunName,Test Run
+
+[Reads]
+Read1Cycles,151
+
+[BCLConvert_Settings]
+AdapterRead1,AGATCGGAAGAGCACACGTCTGAACTCCAGTCA
+
+[BCLConvert_Data]
+Sample_ID,Index
+Sample1,ATCACGTT
+Sample2,CGATGTTT
+
+[Version]
+Software,1.0
+
+[BCLConvert_Data_Header]
+Key1,Value1
+
+[DragenGermline_Data]
+Sample_ID,ReferenceGenomeDir
+Sample1,hg38
+Sample2,hg19
+""")
+    
+    # Parse the file
+    metadata = parser.parse(custom_sections_v2_path)
+    
+    # Custom sections named like parsed keys are ignored
+    assert metadata["version"] == 2
+    assert metadata["bclconvert_data_header"] == ["Sample_ID", "Index"]
+    assert len(parser.get_samples(metadata)) == 2
+    
+    # Custom *_Data sections are read as tables
+    assert metadata["dragengermline_data_header"] == ["Sample_ID", "ReferenceGenomeDir"]
+    assert metadata["dragengermline_data"] == [
+        {"Sample_ID": "Sample1", "ReferenceGenomeDir": "hg38"},
+        {"Sample_ID": "Sample2", "ReferenceGenomeDir": "hg19"},
+    ]
+    
+    # Validate the metadata (should pass)
+    assert parser.validate(metadata) is True
+
+
 @pytest.mark.unit
 def test_parser_factory_with_nonexistent_file() -> None:
     """Test parser factory with nonexistent file."""
@@ -437,11 +417,9 @@ def test_parser_factory_with_unsupported_files(temp_dir: str) -> None:
     os.makedirs(unsupported_dir)
     
     # Create some unsupported files
-    with open(os.path.join(unsupported_dir, "file1.txt"), "w") as f:
-        f.write("This is a text file")
+    write_fixture(unsupported_dir, "file1.txt", "This is a text file")
     
-    with open(os.path.join(unsupported_dir, "file2.json"), "w") as f:
-        f.write('{"key": "value"}')
+    write_fixture(unsupported_dir, "file2.json", '{"key": "value"}')
     
     # Test parsing the directory
     metadata = factory.parse_directory(unsupported_dir)
@@ -464,21 +442,16 @@ def test_parser_factory_with_mixed_files(temp_dir: str, sample_run_info_xml: str
     os.makedirs(mixed_dir)
     
     # Create supported files
-    with open(os.path.join(mixed_dir, "RunInfo.xml"), "w") as f:
-        f.write(sample_run_info_xml)
+    write_fixture(mixed_dir, "RunInfo.xml", sample_run_info_xml)
     
-    with open(os.path.join(mixed_dir, "RunParameters.xml"), "w") as f:
-        f.write(sample_run_parameters_xml)
+    write_fixture(mixed_dir, "RunParameters.xml", sample_run_parameters_xml)
     
-    with open(os.path.join(mixed_dir, "SampleSheet.csv"), "w") as f:
-        f.write(sample_samplesheet_csv)
+    write_fixture(mixed_dir, "SampleSheet.csv", sample_samplesheet_csv)
     
     # Create unsupported files
-    with open(os.path.join(mixed_dir, "file1.txt"), "w") as f:
-        f.write("This is a text file")
+    write_fixture(mixed_dir, "file1.txt", "This is a text file")
     
-    with open(os.path.join(mixed_dir, "file2.json"), "w") as f:
-        f.write('{"key": "value"}')
+    write_fixture(mixed_dir, "file2.json", '{"key": "value"}')
     
     # Test parsing the directory
     metadata = factory.parse_directory(mixed_dir)
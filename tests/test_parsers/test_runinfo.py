@@ -1,20 +1,19 @@
 """
 Tests for the RunInfo parser.
 """
-import os
 import pytest
 from typing import Dict, Any
 
 from rodrunner.parsers.runinfo import RunInfoParser
 
+from tests.test_parsers._util import write_fixture
+
 
 @pytest.mark.unit
 def test_runinfo_parser(temp_dir: str, sample_run_info_xml: str) -> None:
     """Test parsing RunInfo.xml."""
     # Create a test RunInfo.xml file
-    run_info_path = os.path.join(temp_dir, "RunInfo.xml")
-    with open(run_info_path, "w") as f:
-        f.write(sample_run_info_xml)
+    run_info_path = write_fixture(temp_dir, "RunInfo.xml", sample_run_info_xml)
     
     # Parse the file
     parser = RunInfoParser()
@@ -35,9 +34,7 @@ def test_runinfo_parser(temp_dir: str, sample_run_info_xml: str) -> None:
 def test_runinfo_parser_validation(temp_dir: str, sample_run_info_xml: str) -> None:
     """Test validation of RunInfo.xml metadata."""
     # Create a test RunInfo.xml file
-    run_info_path = os.path.join(temp_dir, "RunInfo.xml")
-    with open(run_info_path, "w") as f:
-        f.write(sample_run_info_xml)
+    run_info_path = write_fixture(temp_dir, "RunInfo.xml", sample_run_info_xml)
     
     # Parse and validate the file
     parser = RunInfoParser()
@@ -45,19 +42,12 @@ def test_runinfo_parser_validation(temp_dir: str, sample_run_info_xml: str) -> N
     assert parser.validate(metadata) is True
     
     # Test validation with missing required fields
-    incomplete_metadata = metadata.copy()
-    del incomplete_metadata["run_id"]
-    assert parser.validate(incomplete_metadata) is False
+    assert parser.validate_without(metadata, missing_fields={"run_id"}) is False
 
 
 @pytest.mark.unit
-def test_runinfo_parser_invalid_xml(temp_dir: str) -> None:
+def test_runinfo_parser_invalid_xml(invalid_xml_path: str) -> None:
     """Test parsing invalid XML."""
-    # Create an invalid XML file
-    invalid_xml_path = os.path.join(temp_dir, "InvalidRunInfo.xml")
-    with open(invalid_xml_path, "w") as f:
-        f.write("This is not valid XML")
-    
     # Parse the file
     parser = RunInfoParser()
     with pytest.raises(Exception):
@@ -80,9 +70,7 @@ def test_runinfo_parser_missing_elements(temp_dir: str) -> None:
 </RunInfo>
 """
     
-    missing_elements_path = os.path.join(temp_dir, "MissingElements.xml")
-    with open(missing_elements_path, "w") as f:
-        f.write(missing_elements_xml)
+    missing_elements_path = write_fixture(temp_dir, "MissingElements.xml", missing_elements_xml)
     
     # Parse the file
     parser = RunInfoParser()
@@ -97,3 +85,49 @@ def test_runinfo_parser_missing_elements(temp_dir: str) -> None:
     
     # Validate the metadata (should fail due to missing required fields)
     assert parser.validate(metadata) is False
+
+
+@pytest.mark.unit
+def test_runinfo_parser_default_namespace(temp_dir: str, sample_run_info_xml: str) -> None:
+    """Test parsing RunInfo.xml with a default namespace."""
+    namespaced_xml = sample_run_info_xml.replace(
+        "<RunInfo", '<RunInfo xmlns="http://example.com/runinfo"', 1
+    )
+    run_info_path = write_fixture(temp_dir, "RunInfo.xml", namespaced_xml)
+    
+    # Parse the file
+    parser = RunInfoParser()
+    metadata = parser.parse(run_info_path)
+    
+    # Verify parsed metadata matches the namespace-free document
+    assert metadata == parser.parse_bytes(sample_run_info_xml.encode())
+    assert metadata["run_id"] == "220101_M00001_0001_000000000-A1B2C"
+    assert len(metadata["reads"]) == 4
+
+
+@pytest.mark.unit
+def test_runinfo_parser_limits(temp_dir: str, sample_run_info_xml: str) -> None:
+    """Test that oversized files and runs with too many reads are rejected."""
+    run_info_path = write_fixture(temp_dir, "RunInfo.xml", sample_run_info_xml)
+    
+    # Reject files larger than MAX_BYTES before parsing
+    parser = RunInfoParser()
+    parser.MAX_BYTES = 16
+    with pytest.raises(ValueError):
+        parser.parse(run_info_path)
+    with pytest.raises(ValueError):
+        parser.parse_bytes(sample_run_info_xml.encode())
+    
+    # Reject runs with more than MAX_READS reads
+    parser = RunInfoParser()
+    parser.MAX_READS = 3
+    with pytest.raises(ValueError):
+        parser.parse(run_info_path)
+    
+    parser.MAX_READS = 4
+    assert len(parser.parse(run_info_path)["reads"]) == 4
+    
+    # Only Run/Reads/Read elements count towards MAX_READS
+    extra_reads = '<Other><Reads>' + '<Read Number="9" />' * 8 + '</Reads></Other>\n  <Run '
+    other_run_info = sample_run_info_xml.replace('<Run ', extra_reads, 1)
+    assert len(parser.parse_bytes(other_run_info.encode())["reads"]) == 4
@@ -1,20 +1,19 @@
 """
 Tests for the RunParameters parser.
 """
-import os
 import pytest
 from typing import Dict, Any
 
 from rodrunner.parsers.runparameters import RunParametersParser
 
+from tests.test_parsers._util import write_fixture
+
 
 @pytest.mark.unit
 def test_runparameters_parser(temp_dir: str, sample_run_parameters_xml: str) -> None:
     """Test parsing RunParameters.xml."""
     # Create a test RunParameters.xml file
-    run_parameters_path = os.path.join(temp_dir, "RunParameters.xml")
-    with open(run_parameters_path, "w") as f:
-        f.write(sample_run_parameters_xml)
+    run_parameters_path = write_fixture(temp_dir, "RunParameters.xml", sample_run_parameters_xml)
     
     # Parse the file
     parser = RunParametersParser()
@@ -34,9 +33,7 @@ def test_runparameters_parser(temp_dir: str, sample_run_parameters_xml: str) ->
 def test_runparameters_parser_validation(temp_dir: str, sample_run_parameters_xml: str) -> None:
     """Test validation of RunParameters.xml metadata."""
     # Create a test RunParameters.xml file
-    run_parameters_path = os.path.join(temp_dir, "RunParameters.xml")
-    with open(run_parameters_path, "w") as f:
-        f.write(sample_run_parameters_xml)
+    run_parameters_path = write_fixture(temp_dir, "RunParameters.xml", sample_run_parameters_xml)
     
     # Parse and validate the file
     parser = RunParametersParser()
@@ -44,19 +41,12 @@ def test_runparameters_parser_validation(temp_dir: str, sample_run_parameters_xm
     assert parser.validate(metadata) is True
     
     # Test validation with missing required fields
-    incomplete_metadata = metadata.copy()
-    del incomplete_metadata["run_id"]
-    assert parser.validate(incomplete_metadata) is False
+    assert parser.validate_without(metadata, missing_fields={"run_id"}) is False
 
 
 @pytest.mark.unit
-def test_runparameters_parser_invalid_xml(temp_dir: str) -> None:
+def test_runparameters_parser_invalid_xml(invalid_xml_path: str) -> None:
     """Test parsing invalid XML."""
-    # Create an invalid XML file
-    invalid_xml_path = os.path.join(temp_dir, "InvalidRunParameters.xml")
-    with open(invalid_xml_path, "w") as f:
-        f.write("This is not valid XML")
-    
     # Parse the file
     parser = RunParametersParser()
     with pytest.raises(Exception):
@@ -81,9 +71,7 @@ def test_runparameters_parser_different_formats(temp_dir: str) -> None:
 </RunParameters>
 """
     
-    nextseq_path = os.path.join(temp_dir, "NextSeqRunParameters.xml")
-    with open(nextseq_path, "w") as f:
-        f.write(nextseq_xml)
+    nextseq_path = write_fixture(temp_dir, "NextSeqRunParameters.xml", nextseq_xml)
     
     # Parse the file
     parser = RunParametersParser()
@@ -98,3 +86,30 @@ def test_runparameters_parser_different_formats(temp_dir: str) -> None:
     
     # Validate the metadata
     assert parser.validate(metadata) is True
+
+
+@pytest.mark.unit
+def test_runparameters_parser_nested_fields(temp_dir: str) -> None:
+    """Test that only direct children and <Setup> fill the common fields."""
+    xml = """<?xml version="1.0"?>
+<RunParameters>
+  <Setup>
+    <RunID>setup_run_id</RunID>
+    <ApplicationName>MiSeq Control Software</ApplicationName>
+  </Setup>
+  <RunID>220101_M00001_0001_000000000-A1B2C</RunID>
+  <InstrumentType>MiSeq</InstrumentType>
+  <Reagents>
+    <Chemistry>Nested</Chemistry>
+    <ExperimentName>Nested</ExperimentName>
+  </Reagents>
+</RunParameters>
+"""
+    path = write_fixture(temp_dir, "NestedRunParameters.xml", xml)
+    
+    metadata = RunParametersParser().parse(path)
+    
+    assert metadata["run_id"] == "220101_M00001_0001_000000000-A1B2C"
+    assert metadata["application_name"] == "MiSeq Control Software"
+    assert metadata["experiment_name"] == ""
+    assert metadata["chemistry"] == ""
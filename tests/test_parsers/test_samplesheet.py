@@ -1,20 +1,19 @@
 """
 Tests for the SampleSheet parser.
 """
-import os
 import pytest
 from typing import Dict, Any
 
 from rodrunner.parsers.samplesheet import SampleSheetParser
 
+from tests.test_parsers._util import write_fixture
+
 
 @pytest.mark.unit
 def test_samplesheet_parser(temp_dir: str, sample_samplesheet_csv: str) -> None:
     """Test parsing SampleSheet.csv."""
     # Create a test SampleSheet.csv file
-    samplesheet_path = os.path.join(temp_dir, "SampleSheet.csv")
-    with open(samplesheet_path, "w") as f:
-        f.write(sample_samplesheet_csv)
+    samplesheet_path = write_fixture(temp_dir, "SampleSheet.csv", sample_samplesheet_csv)
     
     # Parse the file
     parser = SampleSheetParser()
@@ -41,9 +40,7 @@ def test_samplesheet_parser(temp_dir: str, sample_samplesheet_csv: str) -> None:
 def test_samplesheet_parser_validation(temp_dir: str, sample_samplesheet_csv: str) -> None:
     """Test validation of SampleSheet.csv metadata."""
     # Create a test SampleSheet.csv file
-    samplesheet_path = os.path.join(temp_dir, "SampleSheet.csv")
-    with open(samplesheet_path, "w") as f:
-        f.write(sample_samplesheet_csv)
+    samplesheet_path = write_fixture(temp_dir, "SampleSheet.csv", sample_samplesheet_csv)
     
     # Parse and validate the file
     parser = SampleSheetParser()
@@ -51,23 +48,55 @@ def test_samplesheet_parser_validation(temp_dir: str, sample_samplesheet_csv: st
     assert parser.validate(metadata) is True
     
     # Test validation with missing required sections
-    incomplete_metadata = metadata.copy()
-    del incomplete_metadata["data"]
-    assert parser.validate(incomplete_metadata) is False
+    assert parser.validate_without(metadata, missing_fields={"data"}) is False
 
 
 @pytest.mark.unit
-def test_samplesheet_parser_invalid_format(temp_dir: str) -> None:
-    """Test parsing invalid SampleSheet format."""
-    # Create an invalid SampleSheet file
-    invalid_sheet_path = os.path.join(temp_dir, "InvalidSampleSheet.csv")
-    with open(invalid_sheet_path, "w") as f:
-        f.write("This is not a valid SampleSheet format")
+def test_samplesheet_parser_quoted_cells(temp_dir: str) -> None:
+    """Test that quoted cells with commas are kept whole."""
+    samplesheet = """[Header]
+Experiment Name,Quoted
+
+[Data]
+Sample_ID,Sample_Project,Description
+Sample1,Project1,"Tumor, left lobe"
+Sample2,Project1,plain
+"""
+    samplesheet_path = write_fixture(temp_dir, "SampleSheet.csv", samplesheet)
+    
+    parser = SampleSheetParser()
+    metadata = parser.parse(samplesheet_path)
+    
+    assert len(metadata["data"]) == 2
+    assert metadata["data"][0]["Description"] == "Tumor, left lobe"
+    assert metadata["data"][1]["Description"] == "plain"
+
+
+@pytest.mark.unit
+def test_samplesheet_parser_quoted_short_row(temp_dir: str) -> None:
+    """Test that a short data row is rejected when cells are quoted."""
+    samplesheet = """[Header]
+Experiment Name,Quoted
+
+[Data]
+Sample_ID,Sample_Project,Description
+Sample1,Project1,"Tumor, left lobe"
+Sample2,Project1
+"""
+    samplesheet_path = write_fixture(temp_dir, "SampleSheet.csv", samplesheet)
     
+    parser = SampleSheetParser()
+    with pytest.raises(ValueError, match="Row 2 of section 'data'"):
+        parser.parse(samplesheet_path)
+
+
+@pytest.mark.unit
+def test_samplesheet_parser_invalid_format(invalid_samplesheet_path: str) -> None:
+    """Test parsing invalid SampleSheet format."""
     # Parse the file
     parser = SampleSheetParser()
     with pytest.raises(Exception):
-        parser.parse(invalid_sheet_path)
+        parser.parse(invalid_samplesheet_path)
 
 
 @pytest.mark.unit
@@ -104,9 +133,7 @@ Sample1,Project1
 Sample2,Project1
 """
     
-    samplesheet_v2_path = os.path.join(temp_dir, "SampleSheetV2.csv")
-    with open(samplesheet_v2_path, "w") as f:
-        f.write(samplesheet_v2)
+    samplesheet_v2_path = write_fixture(temp_dir, "SampleSheetV2.csv", samplesheet_v2)
     
     # Parse the file
     parser = SampleSheetParser()
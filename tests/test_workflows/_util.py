@@ -0,0 +1,43 @@
+"""
+Helpers for workflow tests.
+"""
+import os
+from pathlib import Path
+from typing import Iterator, Union
+
+
+def iter_run_files(run_dir: Union[str, Path]) -> Iterator[os.DirEntry]:
+    """
+    Iterate over the entries of a run directory.
+    
+    The entries come from a single os.scandir pass, so their is_file() and
+    is_dir() answers are cached and need no extra stat per entry.
+    
+    Args:
+        run_dir: Run directory to list
+    
+    Returns:
+        Iterator over the directory entries
+    """
+    with os.scandir(run_dir) as entries:
+        yield from entries
+
+
+def hardlink_tree(src: Union[str, Path], dst: Union[str, Path]) -> None:
+    """
+    Clone a directory tree by hard-linking its files instead of copying them.
+    
+    The clone shares data with the source, so files in it may be removed
+    but must not be written to.
+    
+    Args:
+        src: Directory to clone
+        dst: Destination directory; must not exist yet
+    """
+    os.mkdir(dst)
+    for entry in iter_run_files(src):
+        target = os.path.join(dst, entry.name)
+        if entry.is_dir(follow_symlinks=False):
+            hardlink_tree(entry.path, target)
+        else:
+            os.link(entry.path, target)
@@ -1,90 +1,82 @@
 """
 Tests for the ingest workflows.
 """
-import os
 import pytest
-from typing import Dict, Any, List
-
-from prefect import flow, task
+import shutil
+from pathlib import Path
 
 from rodrunner.models.config import AppConfig
 from rodrunner.workflows.ingest import ingest_sequencer_runs, ingest_all_sequencer_runs
 
+from tests.test_workflows._util import hardlink_tree
+
 
 @pytest.mark.integration
-def test_ingest_sequencer_runs(app_config: AppConfig, sample_sequencer_run: str, temp_dir: str) -> None:
+def test_ingest_sequencer_runs(app_config: AppConfig, prepared_miseq_template: str, sample_run_name: str,
+                               tmp_path: Path) -> None:
     """Test ingesting sequencer runs."""
     # Set up a test directory with a sequencer run
-    sequencer_dir = os.path.join(temp_dir, "sequencer")
-    miseq_dir = os.path.join(sequencer_dir, "miseq")
-    os.makedirs(miseq_dir)
+    sequencer_dir = tmp_path / "sequencer"
+    miseq_dir = sequencer_dir / "miseq"
+    miseq_dir.mkdir(parents=True)
     
     # Copy the sample run to the miseq directory
-    run_name = os.path.basename(sample_sequencer_run)
-    os.system(f"cp -r {sample_sequencer_run} {miseq_dir}/{run_name}")
+    hardlink_tree(prepared_miseq_template, miseq_dir / sample_run_name)
     
     # Update the config to use our test directory
-    app_config.sequencer.base_dir = sequencer_dir
-    app_config.sequencer.miseq_dir = miseq_dir
+    app_config.sequencer.base_dir = str(sequencer_dir)
+    app_config.sequencer.miseq_dir = str(miseq_dir)
     
     # Run the workflow
     results = ingest_sequencer_runs(
         config=app_config,
         sequencer_type="miseq",
-        root_dir=miseq_dir
+        root_dir=str(miseq_dir)
     )
     
     # Verify the results
     assert len(results) == 1
     assert results[0]["success"] is True
-    assert run_name in results[0]["run_dir"]
+    assert sample_run_name in results[0]["run_dir"]
 
 
 @pytest.mark.integration
-def test_ingest_all_sequencer_runs(app_config: AppConfig, sample_sequencer_run: str, temp_dir: str) -> None:
+def test_ingest_all_sequencer_runs(app_config: AppConfig, prepared_miseq_template: str, sample_run_name: str,
+                                   novaseq_run_info_xml: str, tmp_path: Path) -> None:
     """Test ingesting all sequencer runs."""
     # Set up test directories with sequencer runs
-    sequencer_dir = os.path.join(temp_dir, "sequencer")
-    miseq_dir = os.path.join(sequencer_dir, "miseq")
-    novaseq_dir = os.path.join(sequencer_dir, "novaseq")
-    os.makedirs(miseq_dir)
-    os.makedirs(novaseq_dir)
+    sequencer_dir = tmp_path / "sequencer"
+    miseq_dir = sequencer_dir / "miseq"
+    novaseq_dir = sequencer_dir / "novaseq"
+    sequencer_dir.mkdir()
+    for directory in (miseq_dir, novaseq_dir):
+        directory.mkdir()
     
     # Copy the sample run to the miseq directory
-    run_name = os.path.basename(sample_sequencer_run)
-    os.system(f"cp -r {sample_sequencer_run} {miseq_dir}/{run_name}")
+    template = Path(prepared_miseq_template)
+    hardlink_tree(template, miseq_dir / sample_run_name)
     
     # Create a novaseq run by modifying the instrument ID in RunInfo.xml
-    novaseq_run_dir = os.path.join(novaseq_dir, "220102_A00001_0001_AHGV7DRXX")
-    os.makedirs(novaseq_run_dir)
+    novaseq_run_dir = novaseq_dir / "220102_A00001_0001_AHGV7DRXX"
+    novaseq_run_dir.mkdir()
     
     # Copy files from the sample run
-    os.system(f"cp {sample_sequencer_run}/SampleSheet.csv {novaseq_run_dir}/")
-    os.system(f"cp {sample_sequencer_run}/RunParameters.xml {novaseq_run_dir}/")
-    os.system(f"touch {novaseq_run_dir}/RTAComplete.txt")
+    shutil.copy2(template / "SampleSheet.csv", novaseq_run_dir)
+    shutil.copy2(template / "RunParameters.xml", novaseq_run_dir)
+    (novaseq_run_dir / "RTAComplete.txt").touch()
     
     # Create a modified RunInfo.xml for NovaSeq
-    with open(os.path.join(sample_sequencer_run, "RunInfo.xml"), "r") as f:
-        run_info_content = f.read()
-    
-    # Replace MiSeq instrument ID with NovaSeq instrument ID
-    novaseq_run_info = run_info_content.replace("<Instrument>M00001</Instrument>", 
-                                              "<Instrument>A00001</Instrument>")
-    novaseq_run_info = novaseq_run_info.replace("220101_M00001_0001_000000000-A1B2C", 
-                                              "220102_A00001_0001_AHGV7DRXX")
-    
-    with open(os.path.join(novaseq_run_dir, "RunInfo.xml"), "w") as f:
-        f.write(novaseq_run_info)
+    (novaseq_run_dir / "RunInfo.xml").write_text(novaseq_run_info_xml)
     
     # Update the config to use our test directory
-    app_config.sequencer.base_dir = sequencer_dir
-    app_config.sequencer.miseq_dir = miseq_dir
-    app_config.sequencer.novaseq_dir = novaseq_dir
+    app_config.sequencer.base_dir = str(sequencer_dir)
+    app_config.sequencer.miseq_dir = str(miseq_dir)
+    app_config.sequencer.novaseq_dir = str(novaseq_dir)
     
     # Run the workflow
     results = ingest_all_sequencer_runs(
         config=app_config,
-        root_dir=sequencer_dir
+        root_dir=str(sequencer_dir)
     )
     
     # Verify the results
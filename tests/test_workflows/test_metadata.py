@@ -1,25 +1,25 @@
 """
 Tests for the metadata workflows.
 """
-import os
 import pytest
-from typing import Dict, Any, List
-
-from prefect import flow, task
+from pathlib import Path
 
 from rodrunner.models.config import AppConfig
 from rodrunner.workflows.metadata import update_run_metadata
 from rodrunner.irods.client import iRODSClient
 
+from tests.test_workflows._util import iter_run_files
+
 
 @pytest.mark.integration
 def test_update_run_metadata(app_config: AppConfig, irods_client: iRODSClient, 
-                           sample_sequencer_run: str, temp_dir: str) -> None:
+                           sample_sequencer_run: str, sample_run_name: str, irods_test_prefix: str,
+                           tmp_path: Path) -> None:
     """Test updating run metadata."""
     # First, ingest a run into iRODS
     # This would typically be done by the ingest workflow, but we'll do it manually for testing
-    run_name = os.path.basename(sample_sequencer_run)
-    irods_run_path = f"/tempZone/home/rods/test_metadata_{os.getpid()}/{run_name}"
+    irods_test_collection = f"{irods_test_prefix}_{tmp_path.name}"
+    irods_run_path = f"{irods_test_collection}/{sample_run_name}"
     
     try:
         # Create the collection
@@ -34,9 +34,8 @@ def test_update_run_metadata(app_config: AppConfig, irods_client: iRODSClient,
         
         # Verify the files were uploaded
         assert irods_client.collection_exists(irods_run_path)
-        assert irods_client.data_object_exists(f"{irods_run_path}/RunInfo.xml")
-        assert irods_client.data_object_exists(f"{irods_run_path}/RunParameters.xml")
-        assert irods_client.data_object_exists(f"{irods_run_path}/RTAComplete.txt")
+        for entry in iter_run_files(sample_sequencer_run):
+            assert irods_client.data_object_exists(f"{irods_run_path}/{entry.name}")
         
         # Run the metadata update workflow
         result = update_run_metadata(
@@ -50,8 +49,7 @@ def test_update_run_metadata(app_config: AppConfig, irods_client: iRODSClient,
         assert result["irods_path"] == irods_run_path
         
         # Verify the metadata was updated
-        coll = irods_client.get_collection(irods_run_path)
-        meta_dict = {m.name: m.value for m in coll.metadata.items()}
+        meta_dict = irods_client.get_metadata_dict(irods_run_path)
         
         # Check for metadata extracted from RunInfo.xml
         assert "run_id" in meta_dict
@@ -72,5 +70,4 @@ def test_update_run_metadata(app_config: AppConfig, irods_client: iRODSClient,
     
     finally:
         # Clean up
-        if irods_client.collection_exists(os.path.dirname(irods_run_path)):
-            irods_client.remove_collection(os.path.dirname(irods_run_path), recursive=True)
+        irods_client.remove_collection(irods_test_collection, recursive=True, ignore_missing=True)